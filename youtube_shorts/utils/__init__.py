@@ -20,7 +20,7 @@ try:
     from .metrics_utils import load_metadata_metrics, save_metadata_metrics, add_error_sample
 
     # Date utilities
-    from .date_utils import parse_date, format_date, is_older_than_days
+    from .date_utils import parse_date, parse_dates, format_date, is_older_than_days
 
     # Cache utilities
     from .cache_utils import load_cache, save_cache, cleanup_correlation_cache
@@ -32,13 +32,15 @@ try:
     from .keyword_manager import (
         load_keywords, save_keywords, load_keyword_scores, save_keyword_scores,
         normalize_scores, update_keyword_score, select_keywords, extract_keywords_from_text,
-        get_keyword_performance
+        get_keyword_performance, ScoreTable, ScoreSession
     )
 
     # Metadata generation
     from .metadata_generator import (
         configure_genai_api, generate_metadata_prompt, parse_metadata_response,
-        generate_metadata, validate_metadata, improve_metadata, analyze_metadata_quality
+        generate_metadata, generate_metadata_batch, generate_metadata_async, generate_metadata_many,
+        generate_metadata_concurrent, validate_metadata, improve_metadata, analyze_metadata_quality,
+        Metadata
     )
 
     # Playlist management
@@ -48,13 +50,13 @@ try:
     from .channel_scoring import calculate_channel_score, analyze_channel_performance
 
     __all__ = [
-        # Constants - all constants are imported with *
+        # Constants - eager constants are imported with *; lazy paths are forwarded by __getattr__ below
 
         # Metrics utilities
         'load_metadata_metrics', 'save_metadata_metrics', 'add_error_sample',
 
         # Date utilities
-        'parse_date', 'format_date', 'is_older_than_days',
+        'parse_date', 'parse_dates', 'format_date', 'is_older_than_days',
 
         # Cache utilities
         'load_cache', 'save_cache', 'cleanup_correlation_cache',
@@ -65,11 +67,13 @@ try:
         # Keyword management
         'load_keywords', 'save_keywords', 'load_keyword_scores', 'save_keyword_scores',
         'normalize_scores', 'update_keyword_score', 'select_keywords', 'extract_keywords_from_text',
-        'get_keyword_performance',
+        'get_keyword_performance', 'ScoreTable', 'ScoreSession',
 
         # Metadata generation
         'configure_genai_api', 'generate_metadata_prompt', 'parse_metadata_response',
-        'generate_metadata', 'validate_metadata', 'improve_metadata', 'analyze_metadata_quality',
+        'generate_metadata', 'generate_metadata_batch', 'generate_metadata_async', 'generate_metadata_many',
+        'generate_metadata_concurrent', 'validate_metadata', 'improve_metadata', 'analyze_metadata_quality',
+        'Metadata',
 
         # Playlist management
         'PlaylistManager',
@@ -82,3 +86,11 @@ except ImportError as e:
     import logging
     logging.warning(f"Error importing utility modules: {e}")
     __all__ = []
+
+
+def __getattr__(name):
+    """Forward lazily resolved path constants (e.g. DATA_DIR) to utils.constants (PEP 562)."""
+    from . import constants
+    if name in constants._PATH_SPECS:
+        return getattr(constants, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,6 +14,7 @@ Version: 1.5.0
 import os
 import pickle
 import logging
+import threading
 from typing import Optional, List, Dict, Any, Tuple
 
 # --- NEW: Import constants from the new location ---
@@ -73,6 +74,14 @@ except ImportError:
     logger.warning("pip install google-api-python-client google-auth-httplib2 google-auth-oauthlib")
     GOOGLE_API_AVAILABLE = False
 
+# Try to import the httplib2 transport (used to share one keep-alive connection)
+try:
+    import httplib2
+    import google_auth_httplib2
+    HTTPLIB2_AVAILABLE = True
+except ImportError:
+    HTTPLIB2_AVAILABLE = False
+
 # Try to import Gemini API
 try:
     import google.generativeai as genai
@@ -82,6 +91,73 @@ except ImportError:
     logger.warning("pip install google-generativeai")
     GEMINI_API_AVAILABLE = False
 
+# Timeout (seconds) for the shared HTTP transport
+HTTP_TIMEOUT = 30
+
+# Retries (with exponential backoff) for fetching the API discovery document. API requests
+# are not retried by default: retrying an insert after a server-side success duplicates it
+DISCOVERY_NUM_RETRIES = 3
+
+# httplib2.Http is not thread-safe, so each thread keeps its own transports and the
+# services bound to them:
+#   http_cache: AuthorizedHttp keyed by token file path, so every service built from
+#               the same credentials reuses one pooled TLS connection
+#   service_cache: (service, credentials) keyed by (api_name, api_version, token_path)
+_THREAD_STATE = threading.local()
+
+def _thread_caches() -> Tuple[Dict[str, Any], Dict[Tuple[str, str, str], Tuple[Any, Any]]]:
+    """Get this thread's (http_cache, service_cache), creating them on first use."""
+    if not hasattr(_THREAD_STATE, "http_cache"):
+        _THREAD_STATE.http_cache = {}
+        _THREAD_STATE.service_cache = {}
+    return _THREAD_STATE.http_cache, _THREAD_STATE.service_cache
+
+def _get_authorized_http(creds: Any, token_path: str) -> Optional[Any]:
+    """
+    Get this thread's shared AuthorizedHttp for the given credentials, creating it if needed.
+
+    Args:
+        creds: OAuth2 credentials
+        token_path: Path to the token file the credentials belong to
+
+    Returns:
+        AuthorizedHttp object or None if httplib2 is not available
+    """
+    if not HTTPLIB2_AVAILABLE:
+        return None
+
+    http_cache, service_cache = _thread_caches()
+    http = http_cache.get(token_path)
+    if http is None or http.credentials is not creds:
+        http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+        http_cache[token_path] = http
+        # Services bound to the old transport must be rebuilt
+        for key in [k for k in service_cache if k[2] == token_path]:
+            del service_cache[key]
+    return http
+
+def _refresh_credentials(creds: Any, log_prefix: str = "") -> bool:
+    """
+    Refresh expired credentials in place.
+
+    Args:
+        creds: OAuth2 credentials
+        log_prefix: Prefix for log messages
+
+    Returns:
+        bool: True if the credentials are valid afterwards, False otherwise
+    """
+    if not (creds and creds.expired and creds.refresh_token):
+        return False
+    logger.info(f"{log_prefix}Cached credentials expired. Attempting to refresh...")
+    try:
+        creds.refresh(Request())
+        logger.info(f"{log_prefix}Credentials refreshed successfully.")
+        return creds.valid
+    except Exception as e:
+        logger.warning(f"{log_prefix}Failed to refresh credentials: {e}. Will perform new authentication flow.")
+        return False
+
 def load_config() -> Dict[str, str]:
     """Load configuration from config.txt file."""
     config = {}
@@ -133,10 +209,24 @@ def get_authenticated_service(
     client_secrets_path = client_secrets_file_arg or (constants.CLIENT_SECRETS_FILE if CONSTANTS_IMPORTED else "data/client_secret.json")
     token_path = token_file_arg or (constants.TOKEN_FILE if CONSTANTS_IMPORTED else "data/token.json")
 
+    # Reuse an already built service while its credentials are (or can be made) valid
+    http_cache, service_cache = _thread_caches()
+    service_key = (api_name, api_version, token_path)
+    cached = service_cache.get(service_key)
+    if cached is not None:
+        cached_service, cached_creds = cached
+        if cached_creds.valid or _refresh_credentials(cached_creds, log_prefix):
+            logger.info(f"{log_prefix}Reusing cached {api_name} {api_version} API service.")
+            return cached_service
+        del service_cache[service_key]
+
     creds = None
 
-    # Load cached credentials if they exist
-    if os.path.exists(token_path):
+    # Reuse credentials of the shared transport, else load cached credentials if they exist
+    shared_http = http_cache.get(token_path)
+    if shared_http is not None:
+        creds = shared_http.credentials
+    elif os.path.exists(token_path):
         logger.info(f"{log_prefix}Attempting to load cached credentials from: {token_path}")
         try:
             with open(token_path, 'rb') as token:
@@ -148,14 +238,8 @@ def get_authenticated_service(
 
     # If credentials don't exist or are invalid, get new ones
     if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            logger.info(f"{log_prefix}Cached credentials expired. Attempting to refresh...")
-            try:
-                creds.refresh(Request())
-                logger.info(f"{log_prefix}Credentials refreshed successfully.")
-            except Exception as e:
-                logger.warning(f"{log_prefix}Failed to refresh credentials: {e}. Will perform new authentication flow.")
-                creds = None
+        if creds and creds.expired and creds.refresh_token and not _refresh_credentials(creds, log_prefix):
+            creds = None
 
         # If still no valid credentials, need to authenticate
         if not creds or not creds.valid:
@@ -182,7 +266,12 @@ def get_authenticated_service(
     # Build the API service object
     if creds and creds.valid:
         try:
-            service = build(api_name, api_version, credentials=creds)
+            http = _get_authorized_http(creds, token_path)
+            if http is not None:
+                service = build(api_name, api_version, http=http, num_retries=DISCOVERY_NUM_RETRIES)
+            else:
+                service = build(api_name, api_version, credentials=creds, num_retries=DISCOVERY_NUM_RETRIES)
+            service_cache[service_key] = (service, creds)
             logger.info(f"{log_prefix}{api_name.capitalize()} {api_version} API service built successfully.")
             return service
         except HttpError as e:
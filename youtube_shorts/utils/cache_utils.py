@@ -13,10 +13,27 @@ Version: 1.5.0
 
 import os
 import json
+import mmap
+import hashlib
 import shutil
 import logging
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Set, Tuple, Union
+
+# Platform-specific file locking
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+# Try to import orjson (much faster JSON parsing/serialization)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # --- NEW: Import constants from the new location ---
 try:
@@ -59,6 +76,131 @@ class CustomJSONEncoder(json.JSONEncoder):
         except TypeError:
             return str(obj)  # Convert to string as a last resort
 
+# Cache files larger than this are memory-mapped instead of read into memory
+MMAP_THRESHOLD_BYTES = 65536
+
+# Directories already created (or verified) by this process
+_MKDIR_CACHE: Set[str] = set()
+
+def _ensure_dir(directory: str) -> None:
+    """Create a directory once per process; later calls skip the makedirs syscalls."""
+    if directory and directory not in _MKDIR_CACHE:
+        os.makedirs(directory, exist_ok=True)
+        _MKDIR_CACHE.add(directory)
+
+def _default(obj: Any) -> Any:
+    """orjson fallback serializer for objects it cannot handle natively."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)  # Convert to string as a last resort
+
+def _json_loads(content: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is None:
+        return json.loads(content)
+    return orjson.loads(content)
+
+def _json_dumps(data: Any, compact: bool = False) -> bytes:
+    """Serialize data to JSON bytes (indented unless compact), using orjson when available."""
+    if orjson is None:
+        if compact:
+            return json.dumps(data, ensure_ascii=False, separators=(",", ":"), cls=CustomJSONEncoder).encode("utf-8")
+        return json.dumps(data, ensure_ascii=False, indent=4, cls=CustomJSONEncoder).encode("utf-8")
+    option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    return orjson.dumps(data, default=_default, option=option)
+
+# Digest and (mtime_ns, size) of the last content this process wrote, per path
+_LAST_WRITE: Dict[str, Tuple[bytes, Tuple[int, int]]] = {}
+
+@contextmanager
+def _file_lock(lock_path: str):
+    """Hold an exclusive inter-process lock on lock_path (fcntl on POSIX, msvcrt on Windows)."""
+    with open(lock_path, "a+b") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def _link_backup(src: str, dst: str) -> None:
+    """Back up src to dst with a hard link, copying only if linking is not possible."""
+    if not os.path.exists(src):
+        raise FileNotFoundError(src)
+    try:
+        os.remove(dst)  # os.link will not overwrite an existing file
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        # e.g. filesystems without hard links
+        shutil.copy2(src, dst)
+
+def _write_cache_file(cache_file_path: str, content: bytes, cache_name: str,
+                      backup: bool = True) -> bool:
+    """
+    Atomically replace a cache file with new content.
+
+    The content is written to a temp file and renamed into place while
+    holding an inter-process lock, so concurrent writers never interleave
+    and the cache is never half-written. The write is skipped when the
+    content matches what this process last wrote and the file has not
+    changed on disk since.
+
+    Args:
+        cache_file_path: Path to the cache file
+        content: Serialized cache content
+        cache_name: Name of the cache (for logging)
+        backup: Keep the previous file as <path>.bak
+
+    Returns:
+        bool: True if the file was written, False if the write was skipped
+    """
+    digest = hashlib.blake2b(content, digest_size=16).digest()
+    last_write = _LAST_WRITE.get(cache_file_path)
+    if last_write is not None and last_write[0] == digest and _file_signature(cache_file_path) == last_write[1]:
+        return False
+
+    with _file_lock(f"{cache_file_path}.lock"):
+        temp_path = f"{cache_file_path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(content)
+
+        # Hard-link the current file to the backup path first, so the cache
+        # path always exists; the os.replace below leaves the link intact
+        if backup:
+            backup_path = f"{cache_file_path}.bak"
+            try:
+                _link_backup(cache_file_path, backup_path)
+                logger.info("Created backup of %s at: %s", cache_name, backup_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning("Could not create backup of %s: %s", cache_name, e)
+
+        # Move the new data into place
+        os.replace(temp_path, cache_file_path)
+        _LAST_WRITE[cache_file_path] = (digest, _file_signature(cache_file_path))
+
+    return True
+
 def load_cache(cache_file_path: str, cache_name: str = "Cache",
               default_value: Any = None) -> Any:
     """
@@ -77,35 +219,41 @@ def load_cache(cache_file_path: str, cache_name: str = "Cache",
         default_value = {"timestamp": datetime.now().isoformat()}
 
     try:
-        if os.path.exists(cache_file_path):
-            with open(cache_file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                if not content:
-                    logger.info(f"{cache_name} file exists but is empty. Initializing new cache.")
-                    return default_value
-
-                cache = json.loads(content)
-
-                # Validate cache format if default_value is a dict or list
-                if isinstance(default_value, dict) and not isinstance(cache, dict):
-                    logger.warning(f"{cache_name} file has invalid format (expected dict). Initializing new cache.")
-                    return default_value
-                elif isinstance(default_value, list) and not isinstance(cache, list):
-                    logger.warning(f"{cache_name} file has invalid format (expected list). Initializing new cache.")
-                    return default_value
-
-                return cache
-        else:
-            logger.info(f"{cache_name} file not found. Creating new cache.")
+        with open(cache_file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                logger.info("%s file exists but is empty. Initializing new cache.", cache_name)
+                return default_value
+
+            if orjson is not None and size > MMAP_THRESHOLD_BYTES:
+                # Parse large files in place from the page cache (no read() copy)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        cache = orjson.loads(view)
+            else:
+                cache = _json_loads(f.read())
+
+        # Validate cache format if default_value is a dict or list
+        if isinstance(default_value, dict) and not isinstance(cache, dict):
+            logger.warning("%s file has invalid format (expected dict). Initializing new cache.", cache_name)
+            return default_value
+        elif isinstance(default_value, list) and not isinstance(cache, list):
+            logger.warning("%s file has invalid format (expected list). Initializing new cache.", cache_name)
             return default_value
+
+        return cache
+    except FileNotFoundError:
+        logger.info("%s file not found. Creating new cache.", cache_name)
+        return default_value
     except json.JSONDecodeError:
-        logger.error(f"Error decoding JSON from {cache_name} file. Initializing new cache.")
+        logger.error("Error decoding JSON from %s file. Initializing new cache.", cache_name)
         return default_value
     except Exception as e:
-        logger.error(f"Error loading {cache_name}: {e}")
+        logger.error("Error loading %s: %s", cache_name, e)
         return default_value
 
-def save_cache(cache_data: Any, cache_file_path: str, cache_name: str = "Cache") -> bool:
+def save_cache(cache_data: Any, cache_file_path: str, cache_name: str = "Cache",
+               compact: bool = False) -> bool:
     """
     Saves cache data to a JSON file.
 
@@ -113,46 +261,77 @@ def save_cache(cache_data: Any, cache_file_path: str, cache_name: str = "Cache")
         cache_data: Cache data to save
         cache_file_path: Path to the cache file
         cache_name: Name of the cache (for logging)
+        compact: Write without indentation (smaller and faster, for machine-read caches)
 
     Returns:
         bool: True if successful, False otherwise
     """
     try:
         # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(cache_file_path), exist_ok=True)
+        _ensure_dir(os.path.dirname(cache_file_path))
 
-        # Create backup of existing file if it exists
-        if os.path.exists(cache_file_path):
-            backup_path = f"{cache_file_path}.bak"
-            try:
-                shutil.copy2(cache_file_path, backup_path)
-                logger.info(f"Created backup of {cache_name} at: {backup_path}")
-            except Exception as e:
-                logger.warning(f"Could not create backup of {cache_name}: {e}")
-
-        # Save the file
-        with open(cache_file_path, "w", encoding="utf-8") as f:
-            json.dump(cache_data, f, ensure_ascii=False, indent=4, cls=CustomJSONEncoder)
+        content = _json_dumps(cache_data, compact=compact)
+        if not _write_cache_file(cache_file_path, content, cache_name):
+            logger.debug("%s unchanged since last save. Skipping write.", cache_name)
+            return True
 
         # Log success message
         if isinstance(cache_data, dict) and "timestamp" in cache_data:
-            logger.info(f"Saved {cache_name} with {len(cache_data) - 1} entries.")
+            logger.info("Saved %s with %s entries.", cache_name, len(cache_data) - 1)
         elif isinstance(cache_data, list):
-            logger.info(f"Saved {cache_name} with {len(cache_data)} entries.")
+            logger.info("Saved %s with %s entries.", cache_name, len(cache_data))
         else:
-            logger.info(f"Saved {cache_name}.")
+            logger.info("Saved %s.", cache_name)
 
         return True
     except (IOError, PermissionError) as e:
-        logger.error(f"Failed to save {cache_name} due to file access error: {e}")
+        logger.error("Failed to save %s due to file access error: %s", cache_name, e)
         return False
     except TypeError as e:
-        logger.error(f"JSON serialization error: {e}. Data might contain unserializable objects.")
+        logger.error("JSON serialization error: %s. Data might contain unserializable objects.", e)
         return False
     except Exception as e:
-        logger.error(f"Error saving {cache_name}: {e}")
+        logger.error("Error saving %s: %s", cache_name, e)
         return False
 
+def _entry_added_time(entry: Any) -> Optional[datetime]:
+    """
+    Get the parsed "added_timestamp" of a correlation cache entry.
+
+    Args:
+        entry: Correlation cache entry
+
+    Returns:
+        datetime or None if the timestamp is missing, invalid or the entry is malformed
+    """
+    try:
+        timestamp_str = entry.get("added_timestamp")
+        if not timestamp_str:
+            logger.warning("Missing timestamp in correlation cache entry: %s. Keeping entry.", entry.get('video_index', 'Unknown'))
+            return None
+
+        # Entries are written with datetime.isoformat(), so try the C fast path
+        # first and only fall back to robust date parsing when it fails
+        try:
+            added_time = datetime.fromisoformat(timestamp_str)
+        except (ValueError, TypeError):
+            added_time = None
+        if added_time is None or added_time.tzinfo is not None:
+            added_time = parse_date(timestamp_str)
+
+        # If we couldn't parse the date, keep the entry
+        if added_time is None:
+            logger.warning("Could not parse timestamp '%s' in correlation cache entry: %s. Keeping entry.", timestamp_str, entry.get('video_index', 'Unknown'))
+        elif added_time.tzinfo is not None:
+            # Offset-aware times cannot be compared with the naive cutoff date
+            logger.warning("Error processing cache entry: timezone-aware timestamp '%s'", timestamp_str)
+            return None
+        return added_time
+    except Exception as e:
+        # Keep entries that cause errors
+        logger.warning("Error processing cache entry: %s", e)
+        return None
+
 def cleanup_correlation_cache(cache_file_path: str, days_to_keep: int = 7) -> bool:
     """
     Removes entries older than specified days from the correlation cache.
@@ -173,56 +352,33 @@ def cleanup_correlation_cache(cache_file_path: str, days_to_keep: int = 7) -> bo
     now = datetime.now()
     cutoff_date = now - timedelta(days=days_to_keep)
     original_count = len(cache)
-    cleaned_cache = []
-    removed_count = 0
-    invalid_count = 0
 
-    for entry in cache:
-        try:
-            timestamp_str = entry.get("added_timestamp")
-            if not timestamp_str:
-                logger.warning(f"Missing timestamp in correlation cache entry: {entry.get('video_index', 'Unknown')}. Keeping entry.")
-                cleaned_cache.append(entry)
-                invalid_count += 1
-                continue
-
-            # Use robust date parsing
-            added_time = parse_date(timestamp_str)
-
-            # If we couldn't parse the date, keep the entry
-            if added_time is None:
-                logger.warning(f"Could not parse timestamp '{timestamp_str}' in correlation cache entry: {entry.get('video_index', 'Unknown')}. Keeping entry.")
-                cleaned_cache.append(entry)
-                invalid_count += 1
-                continue
-
-            # Check if the entry is newer than the cutoff date
-            if added_time >= cutoff_date:
-                cleaned_cache.append(entry)
-            else:
-                removed_count += 1
-
-        except Exception as e:
-            # Keep entries that cause errors
-            logger.warning(f"Error processing cache entry: {e}")
-            cleaned_cache.append(entry)
-            invalid_count += 1
+    # Entries without a usable timestamp map to None and are always kept
+    added_times = [_entry_added_time(entry) for entry in cache]
+    cleaned_cache = [entry for entry, added_time in zip(cache, added_times)
+                     if added_time is None or added_time >= cutoff_date]
+    invalid_count = added_times.count(None)
+    removed_count = original_count - len(cleaned_cache)
 
     if removed_count > 0:
-        success = save_cache(cleaned_cache, cache_file_path, "Correlation Cache")
+        success = save_cache(cleaned_cache, cache_file_path, "Correlation Cache", compact=True)
         if success:
-            logger.info(f"Cleaned correlation cache: removed {removed_count} of {original_count} entries older than {days_to_keep} days.")
+            logger.info("Cleaned correlation cache: removed %s of %s entries older than %s days.", removed_count, original_count, days_to_keep)
         else:
             logger.error("Failed to save cleaned correlation cache.")
             return False
     else:
-        logger.info(f"No old entries to remove from correlation cache (keeping all {original_count} entries).")
+        logger.info("No old entries to remove from correlation cache (keeping all %s entries).", original_count)
 
     if invalid_count > 0:
-        logger.warning(f"Found {invalid_count} entries with invalid or missing timestamps in correlation cache.")
+        logger.warning("Found %s entries with invalid or missing timestamps in correlation cache.", invalid_count)
 
     return True
 
+# Opening/closing bytes of a JSON object or array, and how much of each end to inspect
+_JSON_CONTAINER_BOUNDS = {(b"{", b"}"), (b"[", b"]")}
+_VALIDITY_PROBE_BYTES = 64
+
 def is_cache_valid(cache_file_path: str, max_age_days: int = 7) -> bool:
     """
     Check if a cache file is valid and not expired.
@@ -235,26 +391,32 @@ def is_cache_valid(cache_file_path: str, max_age_days: int = 7) -> bool:
         bool: True if cache is valid and not expired, False otherwise
     """
     try:
-        if not os.path.exists(cache_file_path):
+        # A single stat() serves the existence, size and age checks
+        try:
+            st = os.stat(cache_file_path)
+        except FileNotFoundError:
             logger.debug(f"Cache file not found: {cache_file_path}")
             return False
 
         # Check if file is empty
-        if os.path.getsize(cache_file_path) == 0:
+        if st.st_size == 0:
             logger.debug(f"Cache file is empty: {cache_file_path}")
             return False
 
         # Check if file is too old
-        file_age_days = (datetime.now() - datetime.fromtimestamp(os.path.getmtime(cache_file_path))).days
+        file_age_days = (datetime.now() - datetime.fromtimestamp(st.st_mtime)).days
         if file_age_days > max_age_days:
             logger.debug(f"Cache file expired ({file_age_days} days old): {cache_file_path}")
             return False
 
-        # Try to load the file to verify it's valid JSON
-        try:
-            with open(cache_file_path, "r", encoding="utf-8") as f:
-                json.load(f)
-        except json.JSONDecodeError:
+        # Cheap structural check instead of a full parse: the outermost
+        # brackets must match (load_cache still handles malformed content)
+        with open(cache_file_path, "rb") as f:
+            head = f.read(_VALIDITY_PROBE_BYTES).lstrip()
+            if st.st_size > _VALIDITY_PROBE_BYTES:
+                f.seek(-_VALIDITY_PROBE_BYTES, os.SEEK_END)
+            tail = (f.read() or head).rstrip()
+        if not head or not tail or (head[:1], tail[-1:]) not in _JSON_CONTAINER_BOUNDS:
             logger.debug(f"Cache file contains invalid JSON: {cache_file_path}")
             return False
 
@@ -274,15 +436,48 @@ def get_cache_age_days(cache_file_path: str) -> Optional[int]:
         int: Age of the cache in days or None if file doesn't exist
     """
     try:
-        if not os.path.exists(cache_file_path):
+        try:
+            st = os.stat(cache_file_path)
+        except FileNotFoundError:
             return None
 
-        file_age_days = (datetime.now() - datetime.fromtimestamp(os.path.getmtime(cache_file_path))).days
+        file_age_days = (datetime.now() - datetime.fromtimestamp(st.st_mtime)).days
         return file_age_days
     except Exception as e:
         logger.warning(f"Error getting cache age: {e}")
         return None
 
+def get_cache_ages(cache_file_paths: List[str]) -> Dict[str, Optional[int]]:
+    """
+    Get the ages of several cache files in days with one directory scan per directory.
+
+    Args:
+        cache_file_paths: Paths to the cache files
+
+    Returns:
+        Dict mapping each path to its age in days, or None if the file doesn't exist
+    """
+    ages: Dict[str, Optional[int]] = {path: None for path in cache_file_paths}
+    names_by_dir: Dict[str, Dict[str, str]] = defaultdict(dict)
+    for path in cache_file_paths:
+        directory, name = os.path.split(path)
+        names_by_dir[directory][name] = path
+
+    now = datetime.now()
+    for directory, names in names_by_dir.items():
+        try:
+            with os.scandir(directory or ".") as entries:
+                for entry in entries:
+                    path = names.get(entry.name)
+                    if path is not None and entry.is_file():
+                        ages[path] = (now - datetime.fromtimestamp(entry.stat().st_mtime)).days
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            logger.warning(f"Error getting cache ages in {directory}: {e}")
+
+    return ages
+
 def clear_cache(cache_file_path: str, cache_name: str = "Cache") -> bool:
     """
     Clear a cache file.
@@ -295,21 +490,20 @@ def clear_cache(cache_file_path: str, cache_name: str = "Cache") -> bool:
         bool: True if clear was successful, False otherwise
     """
     try:
-        if os.path.exists(cache_file_path):
-            # Create backup before deleting
-            backup_path = f"{cache_file_path}.bak"
-            try:
-                shutil.copy2(cache_file_path, backup_path)
-                logger.info(f"Created backup of {cache_name} at: {backup_path}")
-            except Exception as e:
-                logger.warning(f"Could not create backup of {cache_name}: {e}")
-
-            # Delete the file
+        # Move the file to its backup path; the rename doubles as the existence check
+        backup_path = f"{cache_file_path}.bak"
+        try:
+            os.replace(cache_file_path, backup_path)
+        except FileNotFoundError:
+            logger.info(f"{cache_name} file not found: {cache_file_path}")
+            return True
+        except OSError as e:
+            logger.warning(f"Could not create backup of {cache_name}: {e}")
             os.remove(cache_file_path)
-            logger.info(f"Cleared {cache_name} file: {cache_file_path}")
         else:
-            logger.info(f"{cache_name} file not found: {cache_file_path}")
+            logger.info(f"Created backup of {cache_name} at: {backup_path}")
 
+        logger.info(f"Cleared {cache_name} file: {cache_file_path}")
         return True
     except Exception as e:
         logger.error(f"Error clearing {cache_name} file: {e}")
@@ -8,11 +8,19 @@ This module provides functions for scoring and analyzing YouTube channels.
 
 from typing import Dict, List, Any, Tuple, Optional
 from datetime import datetime, timedelta
+from functools import lru_cache
 import statistics
 import math
 import logging
 import os
 
+# Try to import NumPy for vectorized scoring
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # --- NEW: Import constants from the new location ---
 try:
     from . import constants # Assumes channel_scoring.py is in utils/
@@ -43,6 +51,148 @@ if not logger.handlers and CONSTANTS_IMPORTED:
     logger.addHandler(file_handler)
     logger.setLevel(logging.INFO)
 
+def _mean(values) -> float:
+    """Arithmetic mean of a non-empty sequence or array."""
+    if NUMPY_AVAILABLE:
+        return float(np.mean(values))
+    return statistics.mean(values)
+
+def _stdev(values) -> float:
+    """Sample standard deviation of a sequence or array with at least two values."""
+    if NUMPY_AVAILABLE:
+        return float(np.std(values, ddof=1))
+    return statistics.stdev(values)
+
+@lru_cache(maxsize=4096)
+def _parse_upload_date(upload_date: str) -> Optional[datetime]:
+    """
+    Parse a YYYYMMDD upload date, memoized across scoring/analysis calls.
+
+    Well-formed dates are built directly from the digit slices, which is much
+    cheaper than strptime; anything else goes through strptime as before.
+    """
+    try:
+        if len(upload_date) == 8 and upload_date.isdigit():
+            return datetime(int(upload_date[:4]), int(upload_date[4:6]), int(upload_date[6:8]))
+        return datetime.strptime(upload_date, "%Y%m%d")
+    except (ValueError, TypeError):
+        return None
+
+def _upload_datetime(upload_date: Any) -> Optional[datetime]:
+    """Parsed upload date of a video, or None if missing/invalid."""
+    if not upload_date or not isinstance(upload_date, str):
+        return None
+    return _parse_upload_date(upload_date)
+
+# Precomputed exp(-days/30) recency decay for videos up to a year old
+_RECENCY_LUT = [math.exp(-days / 30) for days in range(366)]
+
+def _recency_score(days_ago: int) -> float:
+    """Recency score (exponential decay, 30-day half-life) for a video age in days."""
+    if 0 <= days_ago < len(_RECENCY_LUT):
+        return _RECENCY_LUT[days_ago]
+    return math.exp(-days_ago / 30)
+
+def _days_ago(upload_date: Any, now: datetime) -> Optional[int]:
+    """Days since a YYYYMMDD upload date, or None if missing/invalid."""
+    upload_datetime = _upload_datetime(upload_date)
+    if upload_datetime is None:
+        return None
+    return (now - upload_datetime).days
+
+def _score_arrays(
+    videos: List[Dict[str, Any]],
+    now: datetime,
+    min_views_threshold: int,
+    min_likes_threshold: int,
+    min_comments_threshold: int
+) -> Tuple[Any, Any, Any, Any, Tuple[int, int, int]]:
+    """
+    Compute per-video view/like/comment/recency scores as NumPy arrays.
+
+    Only videos with a non-zero view count are scored; counts of zero are
+    excluded from their respective score arrays. The view/like/comment
+    totals over all videos are returned from the same conversion pass.
+    """
+    count = len(videos)
+    views = np.fromiter((int(v.get("view_count") or 0) for v in videos), dtype=np.float64, count=count)
+    likes = np.fromiter((int(v.get("like_count") or 0) for v in videos), dtype=np.float64, count=count)
+    comments = np.fromiter((int(v.get("comment_count") or 0) for v in videos), dtype=np.float64, count=count)
+    totals = (int(views.sum()), int(likes.sum()), int(comments.sum()))
+
+    # Skip videos with no views
+    has_views = views != 0
+    views, likes, comments = views[has_views], likes[has_views], comments[has_views]
+
+    # Logarithmic scales, capped at 10
+    view_scores = np.minimum(np.log10(np.maximum(views[views > 0], 10)) / math.log10(min_views_threshold), 10.0)
+    like_scores = np.minimum(np.log10(np.maximum(likes[likes > 0], 10)) / math.log10(min_likes_threshold), 10.0)
+    comment_scores = np.minimum(np.log10(np.maximum(comments[comments > 0], 2)) / math.log10(min_comments_threshold), 10.0)
+
+    # Recency score (exponential decay, 30-day half-life)
+    days_ago = [
+        d for d in (_days_ago(v.get("upload_date"), now) for v, keep in zip(videos, has_views) if keep)
+        if d is not None
+    ]
+    recency_scores = np.exp(-np.asarray(days_ago, dtype=np.float64) / 30)
+
+    return view_scores, like_scores, comment_scores, recency_scores, totals
+
+def _score_lists(
+    videos: List[Dict[str, Any]],
+    now: datetime,
+    min_views_threshold: int,
+    min_likes_threshold: int,
+    min_comments_threshold: int
+) -> Tuple[List[float], List[float], List[float], List[float], Tuple[int, int, int]]:
+    """Pure-Python equivalent of _score_arrays, used when NumPy is not installed."""
+    view_scores = []
+    like_scores = []
+    comment_scores = []
+    recency_scores = []
+    total_views = 0
+    total_likes = 0
+    total_comments = 0
+
+    # Loop-invariant scale factors
+    inv_log_views = 1.0 / math.log10(min_views_threshold)
+    inv_log_likes = 1.0 / math.log10(min_likes_threshold)
+    inv_log_comments = 1.0 / math.log10(min_comments_threshold)
+
+    for video in videos:
+        view_count = int(video.get("view_count") or 0)
+        like_count = int(video.get("like_count") or 0)
+        comment_count = int(video.get("comment_count") or 0)
+        total_views += view_count
+        total_likes += like_count
+        total_comments += comment_count
+
+        # Skip videos with no views or missing data
+        if not view_count:
+            continue
+
+        # View score (logarithmic scale)
+        if view_count > 0:
+            view_score = math.log10(max(view_count, 10)) * inv_log_views
+            view_scores.append(min(view_score, 10.0))  # Cap at 10
+
+        # Like score (logarithmic scale)
+        if like_count > 0:
+            like_score = math.log10(max(like_count, 10)) * inv_log_likes
+            like_scores.append(min(like_score, 10.0))  # Cap at 10
+
+        # Comment score (logarithmic scale)
+        if comment_count > 0:
+            comment_score = math.log10(max(comment_count, 2)) * inv_log_comments
+            comment_scores.append(min(comment_score, 10.0))  # Cap at 10
+
+        # Recency score (exponential decay)
+        days_ago = _days_ago(video.get("upload_date"), now)
+        if days_ago is not None:
+            recency_scores.append(_recency_score(days_ago))
+
+    return view_scores, like_scores, comment_scores, recency_scores, (total_views, total_likes, total_comments)
+
 def calculate_channel_score(
     channel_data: Dict[str, Any],
     view_weight: float = 0.5,
@@ -74,63 +224,30 @@ def calculate_channel_score(
 
     videos = channel_data["videos"]
 
-    # Calculate base metrics
-    view_scores = []
-    like_scores = []
-    comment_scores = []
-    recency_scores = []
-
     now = datetime.now()
 
-    for video in videos:
-        # Skip videos with no views or missing data
-        if "view_count" not in video or not video["view_count"]:
-            continue
-
-        # View score (logarithmic scale)
-        view_count = int(video.get("view_count", 0))
-        if view_count > 0:
-            view_score = math.log10(max(view_count, 10)) / math.log10(min_views_threshold)
-            view_scores.append(min(view_score, 10.0))  # Cap at 10
-
-        # Like score (logarithmic scale)
-        like_count = int(video.get("like_count", 0))
-        if like_count > 0:
-            like_score = math.log10(max(like_count, 10)) / math.log10(min_likes_threshold)
-            like_scores.append(min(like_score, 10.0))  # Cap at 10
-
-        # Comment score (logarithmic scale)
-        comment_count = int(video.get("comment_count", 0))
-        if comment_count > 0:
-            comment_score = math.log10(max(comment_count, 2)) / math.log10(min_comments_threshold)
-            comment_scores.append(min(comment_score, 10.0))  # Cap at 10
-
-        # Recency score (exponential decay)
-        upload_date = video.get("upload_date")
-        if upload_date:
-            try:
-                upload_datetime = datetime.strptime(upload_date, "%Y%m%d")
-                days_ago = (now - upload_datetime).days
-                recency_score = math.exp(-days_ago / 30)  # 30-day half-life
-                recency_scores.append(recency_score)
-            except (ValueError, TypeError):
-                pass
+    if NUMPY_AVAILABLE:
+        view_scores, like_scores, comment_scores, recency_scores, totals = _score_arrays(
+            videos, now, min_views_threshold, min_likes_threshold, min_comments_threshold
+        )
+    else:
+        view_scores, like_scores, comment_scores, recency_scores, totals = _score_lists(
+            videos, now, min_views_threshold, min_likes_threshold, min_comments_threshold
+        )
 
     # If we don't have enough data, return a low score
-    if not view_scores:
+    if len(view_scores) == 0:
         return 0.0
 
     # Calculate weighted average scores
-    avg_view_score = statistics.mean(view_scores) if view_scores else 0
-    avg_like_score = statistics.mean(like_scores) if like_scores else 0
-    avg_comment_score = statistics.mean(comment_scores) if comment_scores else 0
-    avg_recency_score = statistics.mean(recency_scores) if recency_scores else 0.5  # Default to middle value
+    avg_view_score = _mean(view_scores) if len(view_scores) else 0
+    avg_like_score = _mean(like_scores) if len(like_scores) else 0
+    avg_comment_score = _mean(comment_scores) if len(comment_scores) else 0
+    avg_recency_score = _mean(recency_scores) if len(recency_scores) else 0.5  # Default to middle value
 
     # Calculate engagement ratio (likes + comments per view)
     engagement_ratio = 0.0
-    total_views = sum(int(v.get("view_count", 0)) for v in videos if "view_count" in v)
-    total_likes = sum(int(v.get("like_count", 0)) for v in videos if "like_count" in v)
-    total_comments = sum(int(v.get("comment_count", 0)) for v in videos if "comment_count" in v)
+    total_views, total_likes, total_comments = totals
 
     if total_views > 0:
         engagement_ratio = (total_likes + total_comments) / total_views
@@ -139,7 +256,7 @@ def calculate_channel_score(
     consistency_score = 0.0
     if len(view_scores) > 1:
         try:
-            view_stdev = statistics.stdev(view_scores)
+            view_stdev = _stdev(view_scores)
             consistency_score = 1.0 / (1.0 + view_stdev)  # Normalize to 0-1 range
         except statistics.StatisticsError:
             consistency_score = 0.5  # Default to middle value
@@ -193,38 +310,49 @@ def analyze_channel_performance(
         "recommendations": []
     }
 
-    # Analyze each time period
-    for period in time_periods:
-        period_videos = []
+    # Parse every upload date and count once, newest videos first
+    dated_videos = []
+    for video in videos:
+        upload_datetime = _upload_datetime(video.get("upload_date"))
+        if upload_datetime is not None:
+            dated_videos.append((
+                upload_datetime,
+                int(video.get("view_count") or 0),
+                int(video.get("like_count") or 0),
+                int(video.get("comment_count") or 0)
+            ))
+    dated_videos.sort(key=lambda item: item[0], reverse=True)
+
+    # Walk the videos once, snapshotting running totals as each cutoff
+    # (shortest period first) is crossed
+    period_totals = {}
+    video_count = total_views = total_likes = total_comments = 0
+    for period in sorted(set(time_periods)):
         cutoff_date = now - timedelta(days=period)
-
-        for video in videos:
-            upload_date = video.get("upload_date")
-            if upload_date:
-                try:
-                    upload_datetime = datetime.strptime(upload_date, "%Y%m%d")
-                    if upload_datetime >= cutoff_date:
-                        period_videos.append(video)
-                except (ValueError, TypeError):
-                    continue
+        while video_count < len(dated_videos) and dated_videos[video_count][0] >= cutoff_date:
+            _, views, likes, comments = dated_videos[video_count]
+            total_views += views
+            total_likes += likes
+            total_comments += comments
+            video_count += 1
+        period_totals[period] = (video_count, total_views, total_likes, total_comments)
+
+    # Store results for each time period
+    for period in time_periods:
+        video_count, total_views, total_likes, total_comments = period_totals[period]
 
         # Skip if no videos in this period
-        if not period_videos:
+        if not video_count:
             results["periods"][f"{period}_days"] = {"videos": 0}
             continue
 
-        # Calculate metrics for this period
-        total_views = sum(int(v.get("view_count", 0)) for v in period_videos if "view_count" in v)
-        total_likes = sum(int(v.get("like_count", 0)) for v in period_videos if "like_count" in v)
-        total_comments = sum(int(v.get("comment_count", 0)) for v in period_videos if "comment_count" in v)
-
-        avg_views = total_views / len(period_videos) if period_videos else 0
-        avg_likes = total_likes / len(period_videos) if period_videos else 0
-        avg_comments = total_comments / len(period_videos) if period_videos else 0
+        avg_views = total_views / video_count
+        avg_likes = total_likes / video_count
+        avg_comments = total_comments / video_count
 
         # Store period results
         results["periods"][f"{period}_days"] = {
-            "videos": len(period_videos),
+            "videos": video_count,
             "total_views": total_views,
             "total_likes": total_likes,
             "total_comments": total_comments,
@@ -12,9 +12,10 @@ Version: 1.5.0
 """
 
 import os
+import re
 import json
 import logging
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Set, Union, Callable, Tuple
 
 # --- NEW: Import constants ---
 try:
@@ -108,10 +109,72 @@ DEFAULT_CONFIG = {
     "DIVERSITY_FACTOR": 0.2
 }
 
+# Values treated as True for boolean settings
+_TRUTHY = frozenset(("true", "yes", "1", "t", "y"))
+
+def _to_bool(value: str) -> bool:
+    """Convert a config string to a boolean."""
+    return value.lower() in _TRUTHY
+
+def _coercer_for(default: Any) -> Optional[Callable[[str], Any]]:
+    """Return the converter for a setting based on its default value (None for strings)."""
+    if isinstance(default, bool):  # Check bool first, it is a subclass of int
+        return _to_bool
+    if isinstance(default, int):
+        return int
+    if isinstance(default, float):
+        return float
+    return None
+
+# Per-key type converters, derived once from DEFAULT_CONFIG
+_COERCERS = {key: _coercer_for(default) for key, default in DEFAULT_CONFIG.items()}
+
+# Matches "KEY = value" lines; comment lines and lines without "=" never match
+_CONFIG_LINE_RE = re.compile(r'^[ \t]*([^#=\s][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+
+# Parsed configurations keyed by absolute path -> ((mtime_ns, size), config)
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# Config directories already created (or verified) by this process
+_MKDIR_CACHE: Set[str] = set()
+
+def _parse_config_text(text: str) -> Dict[str, Any]:
+    """
+    Parse config.txt content on top of the default configuration.
+
+    Args:
+        text: Content of the configuration file
+
+    Returns:
+        Dict containing configuration values
+    """
+    config = DEFAULT_CONFIG.copy()
+
+    for key, value in _CONFIG_LINE_RE.findall(text):
+        # Convert value to the type of its default (strings are kept as-is)
+        coercer = _COERCERS.get(key)
+        if coercer is None:
+            config[key] = value
+            continue
+        try:
+            config[key] = coercer(value)
+        except ValueError:
+            logger.warning(f"Could not convert {key}={value} to {coercer.__name__}. Using default: {config[key]}")
+
+    return config
+
+def _file_signature(path: str) -> Tuple[int, int]:
+    """Return (mtime_ns, size) of a file, used to detect changes on disk."""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
 def load_config(config_file_arg: Optional[str] = None) -> Dict[str, Any]:
     """
     Load configuration from config.txt file.
 
+    The parsed configuration is cached in memory and reused until the
+    file's modification time or size changes.
+
     Args:
         config_file_arg: Path to the configuration file
 
@@ -119,42 +182,27 @@ def load_config(config_file_arg: Optional[str] = None) -> Dict[str, Any]:
         Dict containing configuration values
     """
     actual_config_path = config_file_arg or (constants.CONFIG_FILE_PATH if CONSTANTS_IMPORTED else "config/config.txt")
-    config = DEFAULT_CONFIG.copy()
+    cache_key = os.path.abspath(actual_config_path)
 
     try:
-        if os.path.exists(actual_config_path):
-            with open(actual_config_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and "=" in line:
-                        key, value = line.split("=", 1)
-                        key = key.strip()
-                        value = value.strip()
-
-                        # Convert value to appropriate type
-                        if key in config and isinstance(config[key], bool):
-                            config[key] = value.lower() in ("true", "yes", "1", "t", "y")
-                        elif key in config and isinstance(config[key], int):
-                            try:
-                                config[key] = int(value)
-                            except ValueError:
-                                logger.warning(f"Could not convert {key}={value} to int. Using default: {config[key]}")
-                        elif key in config and isinstance(config[key], float):
-                            try:
-                                config[key] = float(value)
-                            except ValueError:
-                                logger.warning(f"Could not convert {key}={value} to float. Using default: {config[key]}")
-                        else:
-                            config[key] = value
-
-            logger.info(f"Loaded configuration from {actual_config_path}")
-        else:
-            logger.warning(f"Configuration file not found at {actual_config_path}. Using default values.")
+        signature = _file_signature(actual_config_path)
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1].copy()
+
+        with open(actual_config_path, "r", encoding="utf-8") as f:
+            config = _parse_config_text(f.read())
+
+        _CONFIG_CACHE[cache_key] = (signature, config.copy())
+        logger.info(f"Loaded configuration from {actual_config_path}")
+        return config
+    except FileNotFoundError:
+        logger.warning(f"Configuration file not found at {actual_config_path}. Using default values.")
     except Exception as e:
         logger.error(f"Error loading configuration: {e}")
         logger.warning("Using default configuration values.")
 
-    return config
+    return DEFAULT_CONFIG.copy()
 
 def save_config(config: Dict[str, Any], config_file_arg: Optional[str] = None) -> bool:
     """
@@ -168,18 +216,26 @@ def save_config(config: Dict[str, Any], config_file_arg: Optional[str] = None) -
         bool: True if save was successful, False otherwise
     """
     actual_config_path = config_file_arg or (constants.CONFIG_FILE_PATH if CONSTANTS_IMPORTED else "config/config.txt")
+    cache_key = os.path.abspath(actual_config_path)
 
     try:
         # Ensure config directory exists before writing
-        os.makedirs(os.path.dirname(actual_config_path), exist_ok=True)
+        config_dir = os.path.dirname(actual_config_path)
+        if config_dir and config_dir not in _MKDIR_CACHE:
+            os.makedirs(config_dir, exist_ok=True)
+            _MKDIR_CACHE.add(config_dir)
 
+        text = "".join(f"{key}={value}\n" for key, value in config.items())
         with open(actual_config_path, "w", encoding="utf-8") as f:
-            for key, value in config.items():
-                f.write(f"{key}={value}\n")
+            f.write(text)
+
+        # Cache what a reload of the written file would return
+        _CONFIG_CACHE[cache_key] = (_file_signature(actual_config_path), _parse_config_text(text))
 
         logger.info(f"Configuration saved to {actual_config_path}")
         return True
     except Exception as e:
+        _CONFIG_CACHE.pop(cache_key, None)
         logger.error(f"Error saving configuration: {e}")
         return False
 
@@ -219,4 +275,11 @@ def set_config_value(key: str, value: Any, save: bool = True, config_file_arg: O
     if save:
         return save_config(config, config_file_arg)
 
+    # Keep the unsaved change in the in-memory cache so later loads see it
+    # (until the file changes on disk or the next save writes it out)
+    actual_config_path = config_file_arg or (constants.CONFIG_FILE_PATH if CONSTANTS_IMPORTED else "config/config.txt")
+    cached = _CONFIG_CACHE.get(os.path.abspath(actual_config_path))
+    if cached is not None:
+        cached[1][key] = value
+
     return True
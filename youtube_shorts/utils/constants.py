@@ -12,6 +12,9 @@ Version: 1.5.0
 """
 
 import os
+import sys
+from enum import IntEnum
+from pathlib import Path
 
 # --- Base Directory Definitions based on FILE_STRUCTURE.md ---
 # Assumes constants.py is in youtube_shorts/utils/
@@ -22,119 +25,159 @@ CURRENT_FILE_DIR = os.path.dirname(os.path.abspath(__file__))
 PACKAGE_ROOT = os.path.dirname(CURRENT_FILE_DIR) # This is .../Project GTA/youtube_shorts/
 # PROJECT_ROOT is one level up from the package
 PROJECT_ROOT = os.path.dirname(PACKAGE_ROOT)    # This is .../Project GTA/
-
-# --- New Directory Structure Paths ---
-CONFIG_DIR = os.path.join(PROJECT_ROOT, "config")
-DATA_DIR = os.path.join(PROJECT_ROOT, "data")
-DOCS_DIR = os.path.join(PROJECT_ROOT, "docs") # Not typically used in constants, but good to be aware
 LOGS_DIR = os.path.join(PROJECT_ROOT, "logs")
-BACKUPS_DIR = os.path.join(PROJECT_ROOT, "backups")
-DRIVERS_DIR = os.path.join(PROJECT_ROOT, "drivers")
-OUTPUT_DIR = os.path.join(PROJECT_ROOT, "output")
-
-# --- Configuration files (now in config/ directory) ---
-CONFIG_FILE_PATH = os.path.join(CONFIG_DIR, "config.txt")
-CHANNELS_FILE_PATH = os.path.join(CONFIG_DIR, "channels.txt")
-KEYWORDS_FILE_PATH = os.path.join(CONFIG_DIR, "keywords.txt") # Assuming this exists, if not, it will be created there
-SEO_METADATA_PROMPT_FILE = os.path.join(CONFIG_DIR, "seo_metadata_prompt.txt")
-
-# --- Authentication files (now in data/ directory) ---
-CLIENT_SECRETS_FILE = os.path.join(DATA_DIR, "client_secret.json")
-TOKEN_FILE = os.path.join(DATA_DIR, "token.json") # Main token for YouTube Data/Analytics
-ANALYTICS_TOKEN_FILE = os.path.join(DATA_DIR, "youtube_analytics_token.pickle") # Specific token for analytics in analytics.py
-
-# --- Output sub-directories (now under output/) ---
-SHORTS_DOWNLOADS_DIR = os.path.join(OUTPUT_DIR, "shorts_downloads")
-SHORTS_METADATA_DIR = os.path.join(OUTPUT_DIR, "shorts_metadata")
-# Removed SELECTED_VIDEOS_DIR and OPTIMIZED_VIDEOS_DIR as part of A/B testing removal
-# Metadata optimization now happens directly in downloaders
-SCHEDULED_VIDEOS_DIR = os.path.join(OUTPUT_DIR, "scheduled_videos")
-UPLOADED_VIDEOS_DIR = os.path.join(OUTPUT_DIR, "uploaded_videos") # For after upload, if used
-
-# --- Data files (now in data/ directory) ---
-EXCEL_FILE_PATH = os.path.join(DATA_DIR, "shorts_data.xlsx")
-METADATA_METRICS_FILE = os.path.join(DATA_DIR, "metadata_metrics.json")
-PERFORMANCE_METRICS_FILE = os.path.join(DATA_DIR, "performance_metrics.json")
-API_QUOTA_FILE = os.path.join(DATA_DIR, "api_quota_usage.json") # Used by api_utils.py & analytics.py
-CHANNEL_PROCESSED_IDS_CACHE = os.path.join(DATA_DIR, "channel_processed_ids_cache.json")
-CHANNEL_LISTING_CACHE = os.path.join(DATA_DIR, "channel_listing_cache.json")
-UPLOAD_CORRELATION_CACHE = os.path.join(DATA_DIR, "upload_correlation_cache.json")
-# Removed AB_TEST_DATA_FILE as part of A/B testing removal
-GENERATED_KEYWORDS_CACHE_FILE = os.path.join(DATA_DIR, "generated_keywords_cache.json")
-PLAYLIST_DATA_CACHE_FILE = os.path.join(DATA_DIR, "playlists_data_cache.json")
-TRENDING_TOPICS_CACHE_FILE = os.path.join(DATA_DIR, "trending_topics_cache.json") # Used by video_selector.py
-VIDEO_SCORES_CACHE_FILE = os.path.join(DATA_DIR, "video_scores_cache.json") # Used by video_selector.py
-HISTORICAL_PERFORMANCE_FILE = os.path.join(DATA_DIR, "historical_performance.json") # Used by video_selector.py and analytics.py
-CONTENT_CALENDAR_DATA_FILE = os.path.join(DATA_DIR, "content_calendar_data.json") # Used by content_calendar.py
-
-# --- Analytics data sub-directory (under data/) ---
-ANALYTICS_DATA_DIR = os.path.join(DATA_DIR, "analytics_data") # For audience_insights, performance_history from analytics.py
-ANALYTICS_API_CACHE_DIR = os.path.join(ANALYTICS_DATA_DIR, "api_cache") # For analytics.py API caching
-ANALYTICS_REPORTS_DIR = os.path.join(ANALYTICS_DATA_DIR, "analytics_reports") # For HTML reports from analytics.py
-
-# --- Driver files (now in drivers/ directory) ---
-FFMPEG_PATH = os.path.join(DRIVERS_DIR, "ffmpeg.exe")
-GECKODRIVER_PATH = os.path.join(DRIVERS_DIR, "geckodriver.exe") # Note: webdriver-manager usually handles this
-
-# --- Log files (now in logs/ directory) ---
-# General logs
-ERROR_LOG_FILE = os.path.join(LOGS_DIR, "error_log.txt") # A general error log
-EXCEL_UTILS_LOG_FILE = os.path.join(LOGS_DIR, "excel_utils.log")
-UPLOADER_POM_LOG_FILE = os.path.join(LOGS_DIR, "uploader_pom.log")
-CONTENT_CALENDAR_LOG_FILE = os.path.join(LOGS_DIR, "content_calendar.log")
-ANALYTICS_LOG_FILE = os.path.join(LOGS_DIR, "analytics.log")
-# Specific downloader/uploader logs
-DOWNLOADER_KEYWORD_LOG_FILE = os.path.join(LOGS_DIR, "downloader_keyword_log.txt")
-DOWNLOADER_CHANNEL_LOG_FILE = os.path.join(LOGS_DIR, "downloader_channel_log.txt")
-UPLOADER_LOG_FILE = os.path.join(LOGS_DIR, "uploader_log.txt")
-PERFORMANCE_TRACKER_LOG_FILE = os.path.join(LOGS_DIR, "performance_tracker_log.txt")
-# Self-improvement/suggestion logs
-TUNING_SUGGESTIONS_LOG_FILE = os.path.join(LOGS_DIR, "tuning_suggestions.log")
-RUN_SUMMARIES_LOG_FILE = os.path.join(LOGS_DIR, "run_summaries.log")
-SUGGESTED_CHANNELS_LOG_FILE = os.path.join(LOGS_DIR, "suggested_channels.log") # Changed from .txt
-# Removed METADATA_OPTIMIZER_LOG_FILE as metadata optimization is now integrated into downloaders
-VIDEO_SELECTOR_LOG_FILE = os.path.join(LOGS_DIR, "video_selector_log.txt") # For video_selector.py
-# Removed AB_TESTING_LOG_FILE as part of A/B testing removal # For ab_testing.py
-
-# --- Backup sub-directories (under backups/) ---
-EXCEL_BACKUPS_DIR = os.path.join(BACKUPS_DIR, "excel")
-JSON_BACKUPS_DIR = os.path.join(BACKUPS_DIR, "json_data")
-PROMPT_BACKUPS_DIR = os.path.join(BACKUPS_DIR, "prompts")
-
-# --- Other Output Folders (for debugging, etc.) ---
-ERROR_SCREENSHOTS_DIR = os.path.join(OUTPUT_DIR, "error_screenshots") # From base_page.py
-DEBUG_RECORDINGS_DIR = os.path.join(OUTPUT_DIR, "debug_recordings") # From uploader.py
+
+# --- Lazily resolved paths ---
+# Every path below is built on first access by the module-level __getattr__ and then
+# cached as a regular module attribute. Each entry maps a constant to its base constant
+# followed by the path parts joined onto it.
+_PATH_SPECS = {
+    # --- New Directory Structure Paths ---
+    "CONFIG_DIR": ("PROJECT_ROOT", "config"),
+    "DATA_DIR": ("PROJECT_ROOT", "data"),
+    "DOCS_DIR": ("PROJECT_ROOT", "docs"), # Not typically used in constants, but good to be aware
+    "BACKUPS_DIR": ("PROJECT_ROOT", "backups"),
+    "DRIVERS_DIR": ("PROJECT_ROOT", "drivers"),
+    "OUTPUT_DIR": ("PROJECT_ROOT", "output"),
+
+    # --- Configuration files (now in config/ directory) ---
+    "CONFIG_FILE_PATH": ("CONFIG_DIR", "config.txt"),
+    "CHANNELS_FILE_PATH": ("CONFIG_DIR", "channels.txt"),
+    "KEYWORDS_FILE_PATH": ("CONFIG_DIR", "keywords.txt"), # Assuming this exists, if not, it will be created there
+    "SEO_METADATA_PROMPT_FILE": ("CONFIG_DIR", "seo_metadata_prompt.txt"),
+
+    # --- Authentication files (now in data/ directory) ---
+    "CLIENT_SECRETS_FILE": ("DATA_DIR", "client_secret.json"),
+    "TOKEN_FILE": ("DATA_DIR", "token.json"), # Main token for YouTube Data/Analytics
+    "ANALYTICS_TOKEN_FILE": ("DATA_DIR", "youtube_analytics_token.pickle"), # Specific token for analytics in analytics.py
+
+    # --- Output sub-directories (now under output/) ---
+    "SHORTS_DOWNLOADS_DIR": ("OUTPUT_DIR", "shorts_downloads"),
+    "SHORTS_METADATA_DIR": ("OUTPUT_DIR", "shorts_metadata"),
+    # Removed SELECTED_VIDEOS_DIR and OPTIMIZED_VIDEOS_DIR as part of A/B testing removal
+    # Metadata optimization now happens directly in downloaders
+    "SCHEDULED_VIDEOS_DIR": ("OUTPUT_DIR", "scheduled_videos"),
+    "UPLOADED_VIDEOS_DIR": ("OUTPUT_DIR", "uploaded_videos"), # For after upload, if used
+
+    # --- Data files (now in data/ directory) ---
+    "EXCEL_FILE_PATH": ("DATA_DIR", "shorts_data.xlsx"),
+    "METADATA_METRICS_FILE": ("DATA_DIR", "metadata_metrics.json"),
+    "PERFORMANCE_METRICS_FILE": ("DATA_DIR", "performance_metrics.json"),
+    "API_QUOTA_FILE": ("DATA_DIR", "api_quota_usage.json"), # Used by api_utils.py & analytics.py
+    "CHANNEL_PROCESSED_IDS_CACHE": ("DATA_DIR", "channel_processed_ids_cache.json"),
+    "CHANNEL_LISTING_CACHE": ("DATA_DIR", "channel_listing_cache.json"),
+    "UPLOAD_CORRELATION_CACHE": ("DATA_DIR", "upload_correlation_cache.json"),
+    # Removed AB_TEST_DATA_FILE as part of A/B testing removal
+    "GENERATED_KEYWORDS_CACHE_FILE": ("DATA_DIR", "generated_keywords_cache.json"),
+    "METADATA_RESPONSE_CACHE_FILE": ("DATA_DIR", "metadata_response_cache.json"), # Used by metadata_generator.py
+    "PLAYLIST_DATA_CACHE_FILE": ("DATA_DIR", "playlists_data_cache.json"),
+    "TRENDING_TOPICS_CACHE_FILE": ("DATA_DIR", "trending_topics_cache.json"), # Used by video_selector.py
+    "VIDEO_SCORES_CACHE_FILE": ("DATA_DIR", "video_scores_cache.json"), # Used by video_selector.py
+    "HISTORICAL_PERFORMANCE_FILE": ("DATA_DIR", "historical_performance.json"), # Used by video_selector.py and analytics.py
+    "CONTENT_CALENDAR_DATA_FILE": ("DATA_DIR", "content_calendar_data.json"), # Used by content_calendar.py
+
+    # --- Analytics data sub-directory (under data/) ---
+    "ANALYTICS_DATA_DIR": ("DATA_DIR", "analytics_data"), # For audience_insights, performance_history from analytics.py
+    "ANALYTICS_API_CACHE_DIR": ("ANALYTICS_DATA_DIR", "api_cache"), # For analytics.py API caching
+    "ANALYTICS_REPORTS_DIR": ("ANALYTICS_DATA_DIR", "analytics_reports"), # For HTML reports from analytics.py
+
+    # --- Driver files (now in drivers/ directory) ---
+    "FFMPEG_PATH": ("DRIVERS_DIR", "ffmpeg.exe"),
+    "GECKODRIVER_PATH": ("DRIVERS_DIR", "geckodriver.exe"), # Note: webdriver-manager usually handles this
+
+    # --- Log files (now in logs/ directory) ---
+    # General logs
+    "ERROR_LOG_FILE": ("LOGS_DIR", "error_log.txt"), # A general error log
+    "EXCEL_UTILS_LOG_FILE": ("LOGS_DIR", "excel_utils.log"),
+    "UPLOADER_POM_LOG_FILE": ("LOGS_DIR", "uploader_pom.log"),
+    "CONTENT_CALENDAR_LOG_FILE": ("LOGS_DIR", "content_calendar.log"),
+    "ANALYTICS_LOG_FILE": ("LOGS_DIR", "analytics.log"),
+    # Specific downloader/uploader logs
+    "DOWNLOADER_KEYWORD_LOG_FILE": ("LOGS_DIR", "downloader_keyword_log.txt"),
+    "DOWNLOADER_CHANNEL_LOG_FILE": ("LOGS_DIR", "downloader_channel_log.txt"),
+    "UPLOADER_LOG_FILE": ("LOGS_DIR", "uploader_log.txt"),
+    "PERFORMANCE_TRACKER_LOG_FILE": ("LOGS_DIR", "performance_tracker_log.txt"),
+    # Self-improvement/suggestion logs
+    "TUNING_SUGGESTIONS_LOG_FILE": ("LOGS_DIR", "tuning_suggestions.log"),
+    "RUN_SUMMARIES_LOG_FILE": ("LOGS_DIR", "run_summaries.log"),
+    "SUGGESTED_CHANNELS_LOG_FILE": ("LOGS_DIR", "suggested_channels.log"), # Changed from .txt
+    # Removed METADATA_OPTIMIZER_LOG_FILE as metadata optimization is now integrated into downloaders
+    "VIDEO_SELECTOR_LOG_FILE": ("LOGS_DIR", "video_selector_log.txt"), # For video_selector.py
+    # Removed AB_TESTING_LOG_FILE as part of A/B testing removal # For ab_testing.py
+
+    # --- Backup sub-directories (under backups/) ---
+    "EXCEL_BACKUPS_DIR": ("BACKUPS_DIR", "excel"),
+    "JSON_BACKUPS_DIR": ("BACKUPS_DIR", "json_data"),
+    "PROMPT_BACKUPS_DIR": ("BACKUPS_DIR", "prompts"),
+
+    # --- Other Output Folders (for debugging, etc.) ---
+    "ERROR_SCREENSHOTS_DIR": ("OUTPUT_DIR", "error_screenshots"), # From base_page.py
+    "DEBUG_RECORDINGS_DIR": ("OUTPUT_DIR", "debug_recordings"), # From uploader.py
+
+    # --- Template File Paths (relative to PACKAGE_ROOT/data as per FILE_STRUCTURE.md) ---
+    "PACKAGE_DATA_DIR": ("PACKAGE_ROOT", "data"),
+    "CONFIG_TEMPLATE_FILE": ("PACKAGE_DATA_DIR", "config.txt.template"),
+    "CHANNELS_TEMPLATE_FILE": ("PACKAGE_DATA_DIR", "channels.txt.template"),
+    "NICHE_TEMPLATE_FILE": ("PACKAGE_DATA_DIR", "niche.txt.template"),
+}
 
 # --- OAuth scopes (Unchanged) ---
-SCOPES = [
+SCOPES = (
     "https://www.googleapis.com/auth/youtube.readonly",
     "https://www.googleapis.com/auth/yt-analytics.readonly",
-    "https://www.googleapis.com/auth/youtube" # For uploads and playlist management
-]
+    "https://www.googleapis.com/auth/youtube", # For uploads and playlist management
+)
 
 # --- Excel sheet names (Unchanged) ---
-DOWNLOADED_SHEET_NAME = "Downloaded"
-UPLOADED_SHEET_NAME = "Uploaded"
-DOWNLOADED_ARCHIVE_SHEET_NAME = "Downloaded_Archive"
-UPLOADED_ARCHIVE_SHEET_NAME = "Uploaded_Archive"
+# Sheet and column names are interned: they are used as dict/DataFrame keys in bulk Excel updates
+DOWNLOADED_SHEET_NAME = sys.intern("Downloaded")
+UPLOADED_SHEET_NAME = sys.intern("Uploaded")
+DOWNLOADED_ARCHIVE_SHEET_NAME = sys.intern("Downloaded_Archive")
+UPLOADED_ARCHIVE_SHEET_NAME = sys.intern("Uploaded_Archive")
 
 # --- Excel column names (Unchanged) ---
-COLUMN_VIDEO_INDEX = "Video Index"
-COLUMN_OPTIMIZED_TITLE = "Optimized Title"
-COLUMN_ORIGINAL_TITLE = "Original Title"
-COLUMN_DOWNLOADED_DATE = "Downloaded Date"
-COLUMN_VIEWS = "Views"
-COLUMN_UPLOADER = "Uploader"
-COLUMN_VIDEO_ID = "YouTube Video ID"
-COLUMN_UPLOAD_TIMESTAMP = "Upload Timestamp"
-COLUMN_SCHEDULED_TIME = "Scheduled Time"
-COLUMN_PUBLISH_STATUS = "Publish Status"
-COLUMN_VIEWS_YT = "Views (YT)"
-COLUMN_LIKES_YT = "Likes (YT)"
-COLUMN_COMMENTS_YT = "Comments (YT)"
-COLUMN_LAST_UPDATED = "Last Updated"
+COLUMN_VIDEO_INDEX = sys.intern("Video Index")
+COLUMN_OPTIMIZED_TITLE = sys.intern("Optimized Title")
+COLUMN_ORIGINAL_TITLE = sys.intern("Original Title")
+COLUMN_DOWNLOADED_DATE = sys.intern("Downloaded Date")
+COLUMN_VIEWS = sys.intern("Views")
+COLUMN_UPLOADER = sys.intern("Uploader")
+COLUMN_VIDEO_ID = sys.intern("YouTube Video ID")
+COLUMN_UPLOAD_TIMESTAMP = sys.intern("Upload Timestamp")
+COLUMN_SCHEDULED_TIME = sys.intern("Scheduled Time")
+COLUMN_PUBLISH_STATUS = sys.intern("Publish Status")
+COLUMN_VIEWS_YT = sys.intern("Views (YT)")
+COLUMN_LIKES_YT = sys.intern("Likes (YT)")
+COLUMN_COMMENTS_YT = sys.intern("Comments (YT)")
+COLUMN_LAST_UPDATED = sys.intern("Last Updated")
 # Removed COLUMN_TEST_GROUP and COLUMN_TEST_VARIANT as part of A/B testing removal
 
+# --- Excel column positions (0-based, matching the sheet header order) ---
+# For row-by-row loops over tuples, e.g. ws.iter_rows(min_row=2, values_only=True):
+# use row[UploadedCol.VIEWS_YT] instead of looking the header up per row.
+# openpyxl cell columns are 1-based, so add 1 for ws.cell(row=r, column=...).
+class DownloadedCol(IntEnum):
+    VIDEO_INDEX = 0      # COLUMN_VIDEO_INDEX
+    OPTIMIZED_TITLE = 1  # COLUMN_OPTIMIZED_TITLE
+    DOWNLOADED_DATE = 2  # COLUMN_DOWNLOADED_DATE
+    VIEWS = 3            # COLUMN_VIEWS
+    UPLOADER = 4         # COLUMN_UPLOADER
+    ORIGINAL_TITLE = 5   # COLUMN_ORIGINAL_TITLE
+
+
+class UploadedCol(IntEnum):
+    VIDEO_INDEX = 0       # COLUMN_VIDEO_INDEX
+    OPTIMIZED_TITLE = 1   # COLUMN_OPTIMIZED_TITLE
+    VIDEO_ID = 2          # COLUMN_VIDEO_ID
+    UPLOAD_TIMESTAMP = 3  # COLUMN_UPLOAD_TIMESTAMP
+    SCHEDULED_TIME = 4    # COLUMN_SCHEDULED_TIME
+    PUBLISH_STATUS = 5    # COLUMN_PUBLISH_STATUS
+    VIEWS_YT = 6          # COLUMN_VIEWS_YT
+    LIKES_YT = 7          # COLUMN_LIKES_YT
+    COMMENTS_YT = 8       # COLUMN_COMMENTS_YT
+    LAST_UPDATED = 9      # COLUMN_LAST_UPDATED
+
+
 # --- YouTube limits (Unchanged, but good to have them here) ---
 YOUTUBE_TITLE_LIMIT = 100 # Added based on youtube_limits.py
 YOUTUBE_DESCRIPTION_LIMIT = 4950
@@ -191,13 +234,62 @@ RETRY_DELAY_MAX = 30 # seconds
 # --- Logging settings (Unchanged) ---
 # LOG_LEVEL typically configured in individual scripts or logging setup
 
-# --- Template File Paths (relative to PACKAGE_ROOT/data as per FILE_STRUCTURE.md) ---
-PACKAGE_DATA_DIR = os.path.join(PACKAGE_ROOT, "data")
-CONFIG_TEMPLATE_FILE = os.path.join(PACKAGE_DATA_DIR, "config.txt.template")
-CHANNELS_TEMPLATE_FILE = os.path.join(PACKAGE_DATA_DIR, "channels.txt.template")
-NICHE_TEMPLATE_FILE = os.path.join(PACKAGE_DATA_DIR, "niche.txt.template")
-
 # --- Original SCRIPT_DIR and UTILS_DIR (for potential use within utils if needed) ---
 # This assumes constants.py remains in youtube_shorts/utils/
 ORIGINAL_UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
 ORIGINAL_SCRIPT_DIR = os.path.dirname(ORIGINAL_UTILS_DIR) # This would be .../Project GTA/youtube_shorts
+
+
+def __getattr__(name):
+    """Resolve a path constant from _PATH_SPECS on first access (PEP 562)."""
+    spec = _PATH_SPECS.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    base, *parts = spec
+    namespace = globals()
+    base_path = namespace[base] if base in namespace else __getattr__(base)
+    # Interned so equal paths built elsewhere compare (and hash-lookup) by identity
+    resolved = sys.intern(os.path.join(base_path, *parts))
+    namespace[name] = resolved
+    return resolved
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_PATH_SPECS))
+
+
+# Eagerly computed directories that PATHS also exposes
+_BASE_DIR_NAMES = frozenset({
+    "CURRENT_FILE_DIR", "PACKAGE_ROOT", "PROJECT_ROOT", "LOGS_DIR", "ORIGINAL_UTILS_DIR", "ORIGINAL_SCRIPT_DIR",
+})
+
+
+class _PathNamespace:
+    """
+    pathlib.Path views of the path constants, built once on first access.
+
+    The string constants stay the public API; PATHS is for code that wants to
+    join with `/` without re-parsing the string each time, e.g.
+    `PATHS.DATA_DIR / "some_cache.json"`.
+    """
+
+    def __getattr__(self, name):
+        if name not in _PATH_SPECS and name not in _BASE_DIR_NAMES:
+            raise AttributeError(f"PATHS has no path named {name!r}")
+        # getattr on the module resolves lazy paths through __getattr__ above
+        value = Path(getattr(sys.modules[__name__], name))
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(_PATH_SPECS) | _BASE_DIR_NAMES)
+
+
+PATHS = _PathNamespace()
+
+
+# Star imports get the eager constants only; listing the lazy paths here would make
+# `from .constants import *` (as in utils/__init__.py) resolve every one of them.
+# Read lazy paths as attributes, e.g. constants.CONFIG_FILE_PATH.
+__all__ = ([name for name in globals() if name.isupper() and not name.startswith('_')]
+           + ["DownloadedCol", "UploadedCol"])
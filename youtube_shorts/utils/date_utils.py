@@ -13,36 +13,43 @@ Version: 1.5.0
 
 import re
 import os
+import types
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, Union, List, Tuple
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, Optional, Union, List, Tuple
 
 # --- NEW: Import constants from the new location ---
+# Package-relative when imported as utils.date_utils, plain import when run from inside utils/
 try:
-    from . import constants
+    if __package__:
+        from . import constants
+    else:
+        import constants
     CONSTANTS_IMPORTED = True
 except ImportError:
-    try:
-        # Try importing directly if run as a script
-        import constants
-        CONSTANTS_IMPORTED = True
-    except ImportError:
-        CONSTANTS_IMPORTED = False
-        print("CRITICAL: date_utils.py could not import constants.py.")
-        # Define minimal fallbacks if really needed
-        class MinimalConstants:
-            LOGS_DIR = "logs"
-        constants = MinimalConstants()
-        print("WARNING: date_utils.py using minimal fallback constants.")
+    CONSTANTS_IMPORTED = False
+    print("CRITICAL: date_utils.py could not import constants.py. Using minimal fallback constants.")
+    constants = types.SimpleNamespace(LOGS_DIR="logs")
 # --- End NEW Import ---
 
-# Configure logging
+
+class _LazyFileHandler(logging.FileHandler):
+    """FileHandler that creates the log directory and opens its file on the first record."""
+
+    def __init__(self, filename: str):
+        super().__init__(filename, delay=True)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+
+# Configure logging (no file is created or opened until something is logged)
 logger = logging.getLogger(__name__)
 if not logger.handlers and CONSTANTS_IMPORTED:
-    log_dir = constants.LOGS_DIR
-    os.makedirs(log_dir, exist_ok=True)
-    log_file = os.path.join(log_dir, "date_utils.log")
-    file_handler = logging.FileHandler(log_file)
+    log_file = os.path.join(constants.LOGS_DIR, "date_utils.log")
+    file_handler = _LazyFileHandler(log_file)
     file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
     logger.addHandler(file_handler)
     logger.setLevel(logging.INFO)
@@ -54,18 +61,119 @@ else:
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
 
-# Try to import optional dependencies
-try:
-    from dateutil import parser as date_parser
-    DATEUTIL_AVAILABLE = True
-except ImportError:
-    DATEUTIL_AVAILABLE = False
-    logger.warning("dateutil not available. Date parsing will use basic methods.")
+# Optional dependencies (dateutil is imported on first use to keep module import cheap)
+date_parser = None
+DATEUTIL_AVAILABLE = None  # None until _get_dateutil() has tried the import
+
+
+def _get_dateutil():
+    """
+    Import dateutil's parser on first use and cache the result.
+
+    Returns:
+        The dateutil.parser module, or None if dateutil is not installed
+    """
+    global date_parser, DATEUTIL_AVAILABLE
+    if DATEUTIL_AVAILABLE is None:
+        try:
+            from dateutil import parser as _parser
+            date_parser = _parser
+            DATEUTIL_AVAILABLE = True
+        except ImportError:
+            DATEUTIL_AVAILABLE = False
+            logger.warning("dateutil not available. Date parsing will use basic methods.")
+    return date_parser
+
+# strptime formats accepted by parse_date, grouped by the separator that identifies them.
+# A string can only ever match formats from one group, so trying the likely group first
+# gives the same result as trying every format in order.
+_ISO_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S",  # ISO format
+    "%Y-%m-%dT%H:%M:%S.%f",  # ISO format with microseconds
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+)
+_SLASH_FORMATS = (
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y",
+    "%d/%m/%Y %H:%M:%S",
+    "%d/%m/%Y",
+)
+_MONTH_NAME_FORMATS = (
+    "%b %d, %Y",
+    "%d %b %Y",
+)
+_DATE_FORMATS = _ISO_FORMATS + _SLASH_FORMATS + _MONTH_NAME_FORMATS
+
+# strptime fallbacks for parse_youtube_timestamp when dateutil is not installed
+_YOUTUBE_TIMESTAMP_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S",
+)
+
+_DIGIT_RE = re.compile(r'\d')
+
+# Excel stores dates as day counts from this epoch; numeric strings are parsed as such
+_NUMERIC_RE = re.compile(r'^\d+(?:\.\d+)?$')
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+
+# "H:MM" or "HH:MM" with an optional AM/PM suffix (case-insensitive), matched from the start
+_TIME_RE = re.compile(r'(\d{1,2}):(\d{2})(?:\s*([AaPp])[Mm])?')
+
+
+@lru_cache(maxsize=256)
+def _formats_for_shape(shape: str) -> Tuple[str, ...]:
+    """
+    Order the strptime formats so the group matching a date shape is tried first.
+
+    Args:
+        shape: Date string with every digit replaced by '9'
+
+    Returns:
+        Tuple[str, ...]: All formats, most likely group first
+    """
+    if shape[4:5] == '-':
+        candidates = _ISO_FORMATS
+    elif '/' in shape:
+        candidates = _SLASH_FORMATS
+    elif any(ch.isalpha() for ch in shape):
+        candidates = _MONTH_NAME_FORMATS
+    else:
+        return _DATE_FORMATS
+
+    return candidates + tuple(fmt for fmt in _DATE_FORMATS if fmt not in candidates)
+
+def _strip_tz(date_str: str) -> str:
+    """
+    Cut a date string at its timezone suffix (first '+' or 'Z') and trim whitespace.
+
+    Args:
+        date_str: Date string to clean
+
+    Returns:
+        str: The string without its timezone part
+    """
+    end = date_str.find('+')
+    if end == -1:
+        end = len(date_str)
+    zulu = date_str.find('Z', 0, end)
+    if zulu != -1:
+        end = zulu
+    return date_str[:end].strip()
+
+
+# Size of the per-process memo for parse_date / parse_youtube_timestamp results
+PARSE_CACHE_SIZE = 4096
+
 
 def parse_date(date_str: Union[str, None]) -> Optional[datetime]:
     """
     Parse a date string into a datetime object using multiple methods.
 
+    Results are memoized per string, so repeated timestamps are parsed once.
+
     Args:
         date_str: Date string to parse
 
@@ -75,51 +183,113 @@ def parse_date(date_str: Union[str, None]) -> Optional[datetime]:
     if not date_str or not isinstance(date_str, str):
         return None
 
+    return _parse_date_impl(date_str)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_date_impl(date_str: str) -> Optional[datetime]:
+    """Uncached body of parse_date for a non-empty string."""
     # Remove any timezone info for consistency
-    date_str = date_str.split('+')[0].split('Z')[0].strip()
+    date_str = _strip_tz(date_str)
 
-    # Try dateutil parser if available (handles many formats)
-    if DATEUTIL_AVAILABLE:
+    # Purely numeric strings are Excel date numbers (days since 1899-12-30)
+    if _NUMERIC_RE.match(date_str):
+        excel_date = float(date_str)
+        if excel_date > 60:  # Account for Excel's leap year bug
+            excel_date -= 1
         try:
-            return date_parser.parse(date_str)
-        except Exception:
-            pass
+            return _EXCEL_EPOCH + timedelta(days=excel_date)
+        except OverflowError:
+            pass  # Too large to be a serial date (e.g. "20240105"), try the string parsers
+
+    # ISO 8601 strings are handled by the C-level fromisoformat
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
 
-    # Try common formats
-    formats = [
-        "%Y-%m-%dT%H:%M:%S",  # ISO format
-        "%Y-%m-%dT%H:%M:%S.%f",  # ISO format with microseconds
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d",
-        "%m/%d/%Y %H:%M:%S",
-        "%m/%d/%Y",
-        "%d/%m/%Y %H:%M:%S",
-        "%d/%m/%Y",
-        "%b %d, %Y",
-        "%d %b %Y"
-    ]
-
-    for fmt in formats:
+    # Try common formats, starting with the group that fits the string's shape
+    for fmt in _formats_for_shape(_DIGIT_RE.sub('9', date_str[:25])):
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
             continue
 
-    # Try to handle Excel date numbers
-    try:
-        if date_str.replace('.', '', 1).isdigit():
-            # Could be an Excel date number (days since 1899-12-30)
-            excel_date = float(date_str)
-            if excel_date > 60:  # Account for Excel's leap year bug
-                excel_date -= 1
-            delta = timedelta(days=excel_date)
-            return datetime(1899, 12, 30) + delta
-    except Exception:
-        pass
+    # Fall back to dateutil if available (slow, but handles many more formats)
+    parser = _get_dateutil()
+    if parser is not None:
+        try:
+            return parser.parse(date_str)
+        except Exception:
+            pass
 
     logger.warning(f"Could not parse date: {date_str}")
     return None
 
+# Any letter other than the ISO 8601 date/time separator "T"
+_LETTER_EXCEPT_T_RE = re.compile(r'[^\W\dT_]')
+
+def parse_dates(values: Iterable[Any]) -> List[Optional[datetime]]:
+    """
+    Parse a batch of date strings, such as a whole Excel column, in one call.
+
+    When pandas is installed the column is parsed with vectorized pandas calls
+    (Excel serial numbers via to_numeric/to_timedelta, numeric dates via
+    to_datetime). Everything else, or every value when pandas is missing, goes
+    through parse_date one by one, so the result always equals
+    [parse_date(value) for value in values].
+
+    Args:
+        values: Iterable of date strings (non-string values yield None)
+
+    Returns:
+        List[Optional[datetime]]: Parsed datetimes in input order, None where parsing failed
+    """
+    values = list(values)
+    try:
+        import pandas as pd
+    except ImportError:
+        return [parse_date(value) for value in values]
+
+    results: List[Optional[datetime]] = [None] * len(values)
+    strings = pd.Series([value if isinstance(value, str) else None for value in values], dtype=object)
+    # Same timezone stripping as parse_date
+    cleaned = strings.str.replace(r'(?s)[+Z].*', '', regex=True).str.strip()
+    has_text = cleaned.notna() & (cleaned != '')
+
+    # Excel serial numbers (days since 1899-12-30), limited to the range pandas can represent
+    numeric = pd.to_numeric(cleaned.where(cleaned.str.match(_NUMERIC_RE.pattern, na=False)), errors='coerce')
+    excel_mask = numeric.notna() & (numeric < 100000)
+    if excel_mask.any():
+        serial = numeric[excel_mask]
+        serial = serial.where(serial <= 60, serial - 1)  # Account for Excel's leap year bug
+        excel_dates = (pd.Timestamp(_EXCEL_EPOCH) + pd.to_timedelta(serial, unit='D')).dt.round('us')
+        for pos, value in zip(excel_dates.index, excel_dates.dt.to_pydatetime()):
+            results[pos] = value
+
+    # pandas only gets all-numeric dates with year, month and day. Words ("now", "today",
+    # month names) and partial dates go to parse_date, because pandas reads them differently
+    # (relative keywords become the current time, a missing day becomes the 1st)
+    text_mask = (has_text & ~excel_mask & numeric.isna()
+                 & ~cleaned.str.contains(_LETTER_EXCEPT_T_RE.pattern, regex=True, na=True)
+                 & (cleaned.str.count(r'\d+') >= 3))
+    if text_mask.any():
+        try:
+            parsed = pd.to_datetime(cleaned[text_mask], errors='coerce', format='mixed')
+            for pos, value in zip(parsed.index, parsed.dt.to_pydatetime()):
+                if not pd.isna(value):
+                    results[pos] = value
+        except (ValueError, TypeError, AttributeError, OverflowError):
+            # Mixed timezones or an older pandas without format='mixed'
+            pass
+
+    # Anything still unparsed goes through the scalar parser
+    for pos in has_text[has_text].index:
+        if results[pos] is None:
+            results[pos] = parse_date(values[pos])
+
+    return results
+
 def format_date(dt: Optional[datetime], format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
     """
     Format a datetime object as a string.
@@ -152,13 +322,15 @@ def get_days_ago(days: int) -> datetime:
     """
     return datetime.now() - timedelta(days=days)
 
-def is_older_than_days(dt: Optional[datetime], days: int) -> bool:
+def is_older_than_days(dt: Optional[datetime], days: int, *, now: Optional[datetime] = None) -> bool:
     """
     Check if a datetime is older than a specified number of days.
 
     Args:
         dt: Datetime object to check
         days: Number of days
+        now: Reference time (defaults to datetime.now()); pass it in when checking
+            many datetimes in a loop so the clock is read once
 
     Returns:
         bool: True if the datetime is older than the specified number of days, False otherwise
@@ -166,9 +338,30 @@ def is_older_than_days(dt: Optional[datetime], days: int) -> bool:
     if dt is None:
         return False
 
-    cutoff_date = get_days_ago(days)
+    cutoff_date = (now or datetime.now()) - timedelta(days=days)
     return dt < cutoff_date
 
+def iter_older_than(items: Iterable[Any], days: int,
+                    key: Optional[Callable[[Any], Optional[datetime]]] = None) -> Iterator[Any]:
+    """
+    Yield the items whose datetime is older than a specified number of days.
+
+    The cutoff is computed once for the whole batch.
+
+    Args:
+        items: Datetimes, or arbitrary items when key is given
+        days: Number of days
+        key: Optional function returning the datetime of an item (None is never older)
+
+    Returns:
+        Iterator over the matching items, in input order
+    """
+    cutoff_date = get_days_ago(days)
+    for item in items:
+        dt = key(item) if key is not None else item
+        if dt is not None and dt < cutoff_date:
+            yield item
+
 def get_relative_date(days: int) -> str:
     """
     Get a date relative to today.
@@ -195,27 +388,20 @@ def parse_time_of_day(time_str: str) -> Optional[Tuple[int, int]]:
     if not time_str:
         return None
 
-    # Try 12-hour format with AM/PM
-    match = re.match(r'(\d{1,2}):(\d{2})\s*(AM|PM)', time_str.upper())
+    match = _TIME_RE.match(time_str)
     if match:
         hour, minute, period = match.groups()
         hour = int(hour)
         minute = int(minute)
 
-        # Convert to 24-hour format
-        if period == "PM" and hour < 12:
+        # Convert 12-hour format with AM/PM to 24-hour format
+        if period in ('P', 'p') and hour < 12:
             hour += 12
-        elif period == "AM" and hour == 12:
+        elif period in ('A', 'a') and hour == 12:
             hour = 0
 
         return (hour, minute)
 
-    # Try 24-hour format
-    match = re.match(r'(\d{1,2}):(\d{2})', time_str)
-    if match:
-        hour, minute = match.groups()
-        return (int(hour), int(minute))
-
     logger.warning(f"Failed to parse time: {time_str}")
     return None
 
@@ -249,8 +435,8 @@ def days_between(dt1: Optional[datetime], dt2: Optional[datetime]) -> Optional[i
     if dt1 is None or dt2 is None:
         return None
 
-    delta = dt2.date() - dt1.date()
-    return delta.days
+    # Proleptic ordinals count calendar days, same as (dt2.date() - dt1.date()).days
+    return dt2.toordinal() - dt1.toordinal()
 
 def parse_youtube_timestamp(timestamp: str) -> Optional[datetime]:
     """
@@ -265,24 +451,82 @@ def parse_youtube_timestamp(timestamp: str) -> Optional[datetime]:
     if not timestamp:
         return None
 
+    if isinstance(timestamp, str):
+        return _parse_youtube_timestamp_impl(timestamp)
+    # Unhashable or unexpected input: skip the cache and let the parser report it
+    return _parse_youtube_timestamp_impl.__wrapped__(timestamp)
+
+
+def _parse_youtube_timestamp_fast(timestamp: str) -> Optional[datetime]:
+    """
+    Parse the YouTube API shape YYYY-MM-DDTHH:MM:SS[.f{1,6}][(+|-)HH:MM] by slicing.
+
+    Args:
+        timestamp: Timestamp with any trailing 'Z' already rewritten as '+00:00'
+
+    Returns:
+        Optional[datetime]: Parsed datetime, or None if the string has any other shape
+    """
+    end = len(timestamp)
+    if (end < 19 or timestamp[4] != '-' or timestamp[7] != '-' or timestamp[10] != 'T'
+            or timestamp[13] != ':' or timestamp[16] != ':'):
+        return None
+
+    try:
+        tz = None
+        if end >= 25 and timestamp[-6] in '+-' and timestamp[-3] == ':':
+            offset = timestamp[-5:-3] + timestamp[-2:]
+            if not offset.isdigit():
+                return None
+            minutes = int(offset[:2]) * 60 + int(offset[2:])
+            if timestamp[-6] == '-':
+                minutes = -minutes
+            tz = timezone.utc if minutes == 0 else timezone(timedelta(minutes=minutes))
+            end -= 6
+
+        microsecond = 0
+        if end > 19:
+            fraction = timestamp[20:end]
+            if timestamp[19] != '.' or not 0 < len(fraction) <= 6 or not fraction.isdigit():
+                return None
+            microsecond = int(fraction.ljust(6, '0'))
+
+        fields = (timestamp[0:4], timestamp[5:7], timestamp[8:10],
+                  timestamp[11:13], timestamp[14:16], timestamp[17:19])
+        if not all(field.isdigit() for field in fields):
+            return None
+        year, month, day, hour, minute, second = map(int, fields)
+        return datetime(year, month, day, hour, minute, second, microsecond, tz)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_youtube_timestamp_impl(timestamp: str) -> Optional[datetime]:
+    """Uncached body of parse_youtube_timestamp for a non-empty value."""
     try:
         # YouTube timestamps are in ISO 8601 format
         if 'Z' in timestamp:
             # Remove the 'Z' and parse
             timestamp = timestamp.replace('Z', '+00:00')
 
-        if DATEUTIL_AVAILABLE:
-            return date_parser.parse(timestamp)
+        # Fast path: YouTube timestamps are almost always plain ISO 8601
+        try:
+            return datetime.fromisoformat(timestamp)
+        except ValueError:
+            pass
+
+        # Fixed-shape slicer for what older fromisoformat rejects (e.g. 1-5 fraction digits)
+        parsed = _parse_youtube_timestamp_fast(timestamp)
+        if parsed is not None:
+            return parsed
+
+        parser = _get_dateutil()
+        if parser is not None:
+            return parser.parse(timestamp)
         else:
             # Try to parse with strptime
-            formats = [
-                "%Y-%m-%dT%H:%M:%S.%f%z",
-                "%Y-%m-%dT%H:%M:%S%z",
-                "%Y-%m-%dT%H:%M:%S.%f",
-                "%Y-%m-%dT%H:%M:%S"
-            ]
-
-            for fmt in formats:
+            for fmt in _YOUTUBE_TIMESTAMP_FORMATS:
                 try:
                     return datetime.strptime(timestamp, fmt)
                 except ValueError:
@@ -12,6 +12,7 @@ Version: 1.0.0
 """
 
 import os
+import copy
 import json
 import logging
 import random
@@ -20,6 +21,22 @@ import shutil
 from typing import Dict, List, Tuple, Any, Optional, Set, Union
 from datetime import datetime, timedelta
 
+# Try to import orjson (much faster JSON parsing/serialization)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Try to import NumPy for vectorized score math
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Random generator for weighted keyword sampling
+_rng = np.random.default_rng() if NUMPY_AVAILABLE else None
+
 # --- NEW: Import constants from the new location ---
 try:
     from . import constants
@@ -67,6 +84,26 @@ SCORE_DECAY_FACTOR = 0.9  # Score decay for previously used keywords
 SCORE_BOOST_FACTOR = 1.2  # Score boost for successful keywords
 NORMALIZATION_FACTOR = 0.8  # Factor for score normalization
 
+# Characters that are neither word characters nor whitespace become spaces
+_PUNCT_RE = re.compile(r'[^\w\s]')
+# Same mapping for ASCII text, applied with str.translate instead of the regex
+_ASCII_PUNCT_TABLE = str.maketrans({c: ' ' for c in map(chr, range(128)) if _PUNCT_RE.match(c)})
+
+# Common English words that are never useful as search keywords
+_STOPWORDS = frozenset({
+    "a", "an", "the", "and", "or", "but", "nor", "so", "yet", "if", "then", "than",
+    "is", "am", "are", "was", "were", "be", "been", "being", "do", "does", "did",
+    "has", "have", "had", "will", "would", "shall", "should", "can", "could", "may",
+    "might", "must", "not", "no", "of", "in", "on", "at", "to", "for", "from", "by",
+    "with", "about", "into", "onto", "over", "under", "out", "off", "up", "down",
+    "this", "that", "these", "those", "there", "here", "what", "which", "who", "whom",
+    "whose", "when", "where", "why", "how", "all", "any", "both", "each", "few",
+    "more", "most", "other", "some", "such", "only", "own", "same", "too", "very",
+    "just", "also", "its", "it", "you", "your", "yours", "they", "them", "their",
+    "theirs", "our", "ours", "his", "her", "hers", "him", "she", "he", "we", "me",
+    "my", "mine", "i", "as", "via", "per", "while", "after", "before", "again",
+})
+
 def load_keywords(keywords_file: Optional[str] = None) -> List[str]:
     """
     Load keywords from a file.
@@ -82,11 +119,12 @@ def load_keywords(keywords_file: Optional[str] = None) -> List[str]:
     try:
         if os.path.exists(actual_keywords_file):
             with open(actual_keywords_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    # Remove comments and trim whitespace
-                    line = line.split('#')[0].strip()
-                    if line:
-                        keywords.append(line)
+                # Read once; split on "\n" like line iteration does (splitlines also splits on \f, \u2028, ...)
+                lines = f.read().split("\n")
+
+            # Remove comments and trim whitespace
+            stripped = (line.split('#', 1)[0].strip() for line in lines)
+            keywords = [line for line in stripped if line]
 
             logger.info(f"Loaded {len(keywords)} keywords from {actual_keywords_file}")
         else:
@@ -96,6 +134,42 @@ def load_keywords(keywords_file: Optional[str] = None) -> List[str]:
 
     return keywords
 
+def _atomic_write(path: str, content: Union[str, bytes]) -> None:
+    """
+    Replace path with content atomically and durably.
+
+    The content is written to <path>.tmp, flushed and fsynced, and then renamed over
+    path with os.replace, so a crash leaves either the old or the new file, never a
+    partial one. str content is written in text mode as UTF-8, bytes as-is.
+    """
+    temp_path = f"{path}.tmp"
+    if isinstance(content, bytes):
+        f = open(temp_path, "wb")
+    else:
+        f = open(temp_path, "w", encoding="utf-8")
+    with f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+def _fast_backup(src: str, dst: str) -> None:
+    """
+    Back up src to dst with a hard link, copying only if linking is not possible.
+
+    The link shares the file's data instead of copying it. This is only safe because
+    the save functions replace the file with os.replace rather than rewriting it in place.
+    """
+    try:
+        os.remove(dst)  # os.link will not overwrite an existing file
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        # e.g. filesystems without hard links
+        shutil.copy2(src, dst)
+
 def save_keywords(keywords: List[str], keywords_file: Optional[str] = None) -> bool:
     """
     Save keywords to a file.
@@ -125,15 +199,13 @@ def save_keywords(keywords: List[str], keywords_file: Optional[str] = None) -> b
                 except ImportError:
                     # Fallback to simple .bak if excel_utils not available
                     backup_path = f"{actual_keywords_file}.bak"
-                    shutil.copy2(actual_keywords_file, backup_path)
+                    _fast_backup(actual_keywords_file, backup_path)
                     logger.info(f"Created backup of keywords file at: {backup_path} (simple .bak)")
             except Exception as e_bak:
                 logger.warning(f"Could not create backup of keywords file: {e_bak}")
 
-        # Save the file
-        with open(actual_keywords_file, "w", encoding="utf-8") as f:
-            for keyword in keywords:
-                f.write(f"{keyword}\n")
+        # Save the file (replaced atomically, which keeps the backup link intact)
+        _atomic_write(actual_keywords_file, "".join(f"{keyword}\n" for keyword in keywords))
 
         logger.info(f"Saved {len(keywords)} keywords to {actual_keywords_file}")
         return True
@@ -141,16 +213,58 @@ def save_keywords(keywords: List[str], keywords_file: Optional[str] = None) -> b
         logger.error(f"Error saving keywords to {actual_keywords_file}: {e}")
         return False
 
-def load_keyword_scores(scores_file: str) -> Dict[str, float]:
+def _json_loads(content: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is None:
+        return json.loads(content)
+    return orjson.loads(content)
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when available."""
+    if orjson is None:
+        return json.dumps(data, ensure_ascii=False, indent=4).encode("utf-8")
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+def load_keyword_scores(scores_file: str, as_table: bool = False) -> Dict[str, float]:
     """
     Load keyword scores from a JSON file.
 
     Args:
         scores_file: Path to the scores JSON file
+        as_table: Return the scores as a ScoreTable instead of a dict (needs NumPy)
 
     Returns:
         Dict[str, float]: Dictionary of keyword scores
     """
+    data = _load_keyword_scores(scores_file)
+    if as_table:
+        if NUMPY_AVAILABLE:
+            data["scores"] = ScoreTable.from_scores(data["scores"])
+        else:
+            logger.warning("NumPy not available, keeping keyword scores as a dict.")
+    return data
+
+# Parsed scores files keyed by path, with the (mtime_ns, size) they were read at
+_SCORES_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+def _copy_scores_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy scores data so callers cannot modify a cached copy (score values are immutable floats)."""
+    return {key: dict(value) if key == "scores" and isinstance(value, dict) else copy.deepcopy(value)
+            for key, value in data.items()}
+
+def _load_keyword_scores(scores_file: str) -> Dict[str, Any]:
+    """Load the scores JSON file, falling back to empty default scores."""
+    try:
+        st = os.stat(scores_file)
+        signature = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        signature = None
+
+    # Serve unchanged files from memory
+    cached = _SCORES_CACHE.get(scores_file)
+    if cached is not None and cached[0] == signature:
+        return _copy_scores_data(cached[1])
+
     default_scores = {
         "last_updated": datetime.now().isoformat(),
         "scores": {}
@@ -158,14 +272,16 @@ def load_keyword_scores(scores_file: str) -> Dict[str, float]:
 
     try:
         if os.path.exists(scores_file):
-            with open(scores_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(scores_file, "rb") as f:
+                data = _json_loads(f.read())
 
                 # Validate the structure
                 if not isinstance(data, dict) or "scores" not in data:
                     logger.warning(f"Invalid scores file format: {scores_file}. Using default scores.")
                     return default_scores
 
+                if signature is not None:
+                    _SCORES_CACHE[scores_file] = (signature, _copy_scores_data(data))
                 return data
         else:
             logger.info(f"Scores file not found: {scores_file}. Using default scores.")
@@ -182,7 +298,7 @@ def save_keyword_scores(scores_data: Dict[str, Any], scores_file: str) -> bool:
     Save keyword scores to a JSON file.
 
     Args:
-        scores_data: Dictionary of keyword scores
+        scores_data: Dictionary of keyword scores (the scores may be a ScoreTable)
         scores_file: Path to the scores JSON file
 
     Returns:
@@ -195,19 +311,24 @@ def save_keyword_scores(scores_data: Dict[str, Any], scores_file: str) -> bool:
         # Update timestamp
         scores_data["last_updated"] = datetime.now().isoformat()
 
-        # Create backup if file exists
+        # Materialize a ScoreTable as the plain dict stored on disk
+        output_data = scores_data
+        if isinstance(scores_data.get("scores"), ScoreTable):
+            output_data = dict(scores_data, scores=scores_data["scores"].to_scores())
+
+        content = _json_dumps(output_data)
+
+        # Create backup if file exists (a hard link, so the scores file never goes missing)
         if os.path.exists(scores_file):
             backup_path = f"{scores_file}.bak"
             try:
-                import shutil
-                shutil.copy2(scores_file, backup_path)
+                _fast_backup(scores_file, backup_path)
                 logger.info(f"Created backup of scores file at: {backup_path}")
             except Exception as e:
                 logger.warning(f"Could not create backup of scores file: {e}")
 
-        # Save the file
-        with open(scores_file, "w", encoding="utf-8") as f:
-            json.dump(scores_data, f, ensure_ascii=False, indent=4)
+        # Save the file (replaced atomically, so it is never half-written)
+        _atomic_write(scores_file, content)
 
         logger.info(f"Saved scores for {len(scores_data.get('scores', {}))} keywords to {scores_file}")
         return True
@@ -215,16 +336,181 @@ def save_keyword_scores(scores_data: Dict[str, Any], scores_file: str) -> bool:
         logger.error(f"Error saving scores to {scores_file}: {e}")
         return False
 
-def normalize_scores(scores: Dict[str, float]) -> Dict[str, float]:
+def _normalize_array(values: "np.ndarray", min_score: float, range_size: float) -> "np.ndarray":
+    """Normalize a score array with the same arithmetic as the pure-Python loop in normalize_scores."""
+    normalized = MIN_KEYWORD_SCORE + ((values - min_score) / range_size) * (MAX_KEYWORD_SCORE - MIN_KEYWORD_SCORE)
+    normalized = DEFAULT_KEYWORD_SCORE + (normalized - DEFAULT_KEYWORD_SCORE) * NORMALIZATION_FACTOR
+    np.clip(normalized, MIN_KEYWORD_SCORE, MAX_KEYWORD_SCORE, out=normalized)
+    return normalized
+
+def _updated_score(current_score: float, success: bool, download_count: int = 0, view_count: int = 0) -> float:
+    """
+    Calculate the new score of a keyword after a search.
+
+    Args:
+        current_score: Current score of the keyword
+        success: Whether the keyword was successful
+        download_count: Number of videos downloaded
+        view_count: Total view count of downloaded videos
+
+    Returns:
+        float: New score, within [MIN_KEYWORD_SCORE, MAX_KEYWORD_SCORE]
+    """
+    # Calculate score adjustment
+    if success:
+        # Successful keywords get a boost
+        score_adjustment = SCORE_BOOST_FACTOR
+
+        # Additional boost based on download count (0.1 per video, capped at 0.5)
+        if download_count > 0:
+            score_adjustment += 0.5 if download_count >= 5 else download_count * 0.1
+
+        # Additional boost based on view count (0.1 per 10k views, capped at 0.5)
+        if view_count > 0:
+            score_adjustment += 0.5 if view_count >= 50000 else view_count * 1e-5
+    else:
+        # Unsuccessful keywords get a penalty
+        score_adjustment = 1.0 / SCORE_BOOST_FACTOR
+
+    # Apply adjustment and ensure score is within bounds
+    new_score = max(MIN_KEYWORD_SCORE, min(MAX_KEYWORD_SCORE, current_score * score_adjustment))
+
+    # For successful keywords, ensure the score is higher than before
+    if success and current_score >= new_score:
+        # Force a minimum increase for successful keywords
+        new_score = min(MAX_KEYWORD_SCORE, current_score * 1.1)
+
+    return new_score
+
+def _top_indices(values: "np.ndarray", top_n: int) -> "np.ndarray":
+    """
+    Return the indices of the top_n highest values, highest first.
+
+    Uses np.argpartition so only the candidates are sorted; ties keep their
+    original order, matching a stable sort of the whole array.
+    """
+    if top_n < 0:
+        # Same as slicing the sorted list with [:top_n]
+        top_n = max(0, values.size + top_n)
+    if top_n == 0:
+        return np.empty(0, dtype=np.intp)
+    if top_n >= values.size:
+        return np.argsort(-values, kind="stable")
+    # The top_n-th largest value; every value >= it is a candidate, ties included
+    threshold = values[np.argpartition(-values, top_n - 1)[top_n - 1]]
+    candidates = np.flatnonzero(values >= threshold)
+    return candidates[np.argsort(-values[candidates], kind="stable")[:top_n]]
+
+class ScoreTable:
+    """
+    Keyword scores stored as parallel arrays instead of a dict.
+
+    keys[i] is the keyword whose score is values[i] (a float64 NumPy array), and
+    key_to_idx maps each keyword back to its position. Scoring, decay and
+    normalization run over the contiguous values array; the JSON dict is only
+    rebuilt when the scores are saved. Requires NumPy.
+    """
+
+    def __init__(self, keys: Optional[List[str]] = None, values: Optional[Any] = None):
+        self.keys = list(keys) if keys is not None else []
+        if values is None:
+            self.values = np.full(len(self.keys), DEFAULT_KEYWORD_SCORE, dtype=np.float64)
+        else:
+            self.values = np.array(values, dtype=np.float64)
+        self.key_to_idx = {keyword: i for i, keyword in enumerate(self.keys)}
+
+    @classmethod
+    def from_scores(cls, scores: Dict[str, float]) -> "ScoreTable":
+        """Build a table from a {keyword: score} dict."""
+        return cls(list(scores), np.fromiter(scores.values(), dtype=np.float64, count=len(scores)))
+
+    def to_scores(self) -> Dict[str, float]:
+        """Return the scores as a {keyword: score} dict, in table order."""
+        return dict(zip(self.keys, self.values.tolist()))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self.key_to_idx
+
+    def get(self, keyword: str, default: Optional[float] = None) -> Optional[float]:
+        """Return the score of keyword, or default if it has none."""
+        i = self.key_to_idx.get(keyword)
+        return default if i is None else float(self.values[i])
+
+    def _index(self, keyword: str) -> int:
+        """Return the position of keyword, appending it with the default score if missing."""
+        i = self.key_to_idx.get(keyword)
+        if i is None:
+            i = len(self.keys)
+            self.keys.append(keyword)
+            self.key_to_idx[keyword] = i
+            self.values = np.append(self.values, DEFAULT_KEYWORD_SCORE)
+        return i
+
+    def update(self, keyword: str, success: bool, download_count: int = 0, view_count: int = 0) -> None:
+        """Update the score of keyword and decay all others (see update_keyword_score)."""
+        i = self._index(keyword)
+        new_score = _updated_score(float(self.values[i]), success, download_count, view_count)
+        self.values *= SCORE_DECAY_FACTOR
+        np.maximum(self.values, MIN_KEYWORD_SCORE, out=self.values)
+        self.values[i] = new_score
+
+    def normalized(self) -> "ScoreTable":
+        """Return a new table with normalized scores (see normalize_scores)."""
+        if not self.keys:
+            return ScoreTable()
+        min_score = float(self.values.min())
+        max_score = float(self.values.max())
+        if max_score == min_score:
+            return self
+        return ScoreTable(self.keys, _normalize_array(self.values, min_score, max_score - min_score))
+
+    def top(self, top_n: int = 10) -> List[Tuple[str, float]]:
+        """Return the top_n (keyword, score) pairs, highest first; ties keep table order."""
+        return [(self.keys[i], float(self.values[i])) for i in _top_indices(self.values, top_n)]
+
+class ScoreSession:
+    """
+    Load keyword scores once, apply many updates, and save them once.
+
+    Example:
+        with ScoreSession(scores_file) as scores_data:
+            for keyword, success in results:
+                update_keyword_score(scores_data, keyword, success)
+
+    The scores are saved when the block exits normally; if it raises, the
+    file on disk is left untouched.
+    """
+
+    def __init__(self, scores_file: str, as_table: bool = False):
+        self.scores_file = scores_file
+        self.as_table = as_table
+        self.data: Dict[str, Any] = {}
+
+    def __enter__(self) -> Dict[str, Any]:
+        self.data = load_keyword_scores(self.scores_file, as_table=self.as_table)
+        return self.data
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if exc_type is None:
+            save_keyword_scores(self.data, self.scores_file)
+        return False
+
+def normalize_scores(scores: Union[Dict[str, float], ScoreTable]) -> Union[Dict[str, float], ScoreTable]:
     """
     Normalize keyword scores to prevent inflation.
 
     Args:
-        scores: Dictionary of keyword scores
+        scores: Dictionary of keyword scores, or a ScoreTable
 
     Returns:
-        Dict[str, float]: Normalized scores
+        Dict[str, float]: Normalized scores (a ScoreTable if one was passed)
     """
+    if isinstance(scores, ScoreTable):
+        return scores.normalized()
+
     if not scores:
         return {}
 
@@ -237,9 +523,13 @@ def normalize_scores(scores: Dict[str, float]) -> Dict[str, float]:
         return scores
 
     # Normalize scores to range [MIN_KEYWORD_SCORE, MAX_KEYWORD_SCORE]
-    normalized_scores = {}
     range_size = max_score - min_score
 
+    if NUMPY_AVAILABLE:
+        values = np.fromiter(scores.values(), dtype=np.float64, count=len(scores))
+        return dict(zip(scores, _normalize_array(values, min_score, range_size).tolist()))
+
+    normalized_scores = {}
     for keyword, score in scores.items():
         # Linear normalization
         normalized_score = MIN_KEYWORD_SCORE + ((score - min_score) / range_size) * (MAX_KEYWORD_SCORE - MIN_KEYWORD_SCORE)
@@ -254,6 +544,20 @@ def normalize_scores(scores: Dict[str, float]) -> Dict[str, float]:
 
     return normalized_scores
 
+def _make_decay(decay: float = SCORE_DECAY_FACTOR, min_score: float = MIN_KEYWORD_SCORE):
+    """Build the pure-Python score decay loop with its constants bound once instead of read as globals."""
+    def _decay(scores: Dict[str, float], skip: str) -> None:
+        """Decay every score except scores[skip] in place, clamped at min_score."""
+        factor, floor = decay, min_score  # plain locals inside the loop
+        # Only values change, so the dict can be updated while iterating it
+        for k, v in scores.items():
+            if k != skip:
+                v *= factor
+                scores[k] = v if v > floor else floor
+    return _decay
+
+_decay_scores = _make_decay()
+
 def update_keyword_score(scores_data: Dict[str, Any], keyword: str, success: bool,
                         download_count: int = 0, view_count: int = 0) -> Dict[str, Any]:
     """
@@ -272,49 +576,53 @@ def update_keyword_score(scores_data: Dict[str, Any], keyword: str, success: boo
     if "scores" not in scores_data:
         scores_data["scores"] = {}
 
-    # Get current score or default
-    current_score = scores_data["scores"].get(keyword, DEFAULT_KEYWORD_SCORE)
-
-    # Calculate score adjustment
-    if success:
-        # Successful keywords get a boost
-        score_adjustment = SCORE_BOOST_FACTOR
-
-        # Additional boost based on download count
-        if download_count > 0:
-            score_adjustment += min(0.5, download_count * 0.1)
+    scores = scores_data["scores"]
+    if isinstance(scores, ScoreTable):
+        scores.update(keyword, success, download_count, view_count)
+        return scores_data
 
-        # Additional boost based on view count
-        if view_count > 0:
-            score_adjustment += min(0.5, view_count / 10000 * 0.1)
-    else:
-        # Unsuccessful keywords get a penalty
-        score_adjustment = 1.0 / SCORE_BOOST_FACTOR
+    new_score = _updated_score(scores.get(keyword, DEFAULT_KEYWORD_SCORE), success, download_count, view_count)
 
-    # Apply adjustment
-    new_score = current_score * score_adjustment
+    # Update score
+    scores[keyword] = new_score
 
-    # Ensure score is within bounds
-    new_score = max(MIN_KEYWORD_SCORE, min(MAX_KEYWORD_SCORE, new_score))
+    # Apply decay to all other keywords (a ScoreTable decays its contiguous array with NumPy)
+    _decay_scores(scores, keyword)
 
-    # Store the original score for comparison in tests
-    original_score = scores_data["scores"].get(keyword, DEFAULT_KEYWORD_SCORE)
+    return scores_data
 
-    # Update score
-    scores_data["scores"][keyword] = new_score
+def _select_keywords_numpy(keywords: List[str], scores: Dict[str, float],
+                           count: int, used_keywords: Optional[Set[str]]) -> List[str]:
+    """Vectorized select_keywords body: one score array feeds both the top picks and the weighted sample."""
+    get_score = scores.get
+    values = np.fromiter((get_score(k, DEFAULT_KEYWORD_SCORE) for k in keywords),
+                         dtype=np.float64, count=len(keywords))
 
-    # Apply decay to all other keywords
-    for k in list(scores_data["scores"].keys()):
-        if k != keyword:
-            scores_data["scores"][k] *= SCORE_DECAY_FACTOR
-            scores_data["scores"][k] = max(MIN_KEYWORD_SCORE, scores_data["scores"][k])
+    # Penalize recently used keywords
+    if used_keywords:
+        used_mask = np.fromiter(map(used_keywords.__contains__, keywords), dtype=bool, count=len(keywords))
+        np.multiply(values, 0.5, out=values, where=used_mask)
 
-    # For successful keywords, ensure the score is higher than before
-    if success and original_score >= new_score:
-        # Force a minimum increase for successful keywords
-        scores_data["scores"][keyword] = min(MAX_KEYWORD_SCORE, original_score * 1.1)
+    # Always include some top-scoring keywords
+    top_idx = _top_indices(values, max(1, count // 3))
+    selected = [keywords[i] for i in top_idx.tolist()]
+
+    # Select remaining keywords with weighted probability; top picks get zero weight
+    needed = min(count - len(selected), values.size - top_idx.size)
+    if needed > 0:
+        values[top_idx] = 0.0
+        total_score = values.sum()
+        try:
+            if total_score > 0:
+                picks = _rng.choice(values.size, size=needed, replace=True, p=values / total_score)
+            else:
+                picks = _rng.choice(np.delete(np.arange(values.size), top_idx), size=needed, replace=True)
+        except Exception:
+            # Fallback if weighted selection fails
+            picks = _rng.permutation(np.delete(np.arange(values.size), top_idx))[:needed]
+        selected.extend(keywords[i] for i in picks.tolist())
 
-    return scores_data
+    return selected
 
 def select_keywords(keywords: List[str], scores_data: Dict[str, Any],
                    count: int = 10, used_keywords: Optional[Set[str]] = None) -> List[str]:
@@ -325,7 +633,7 @@ def select_keywords(keywords: List[str], scores_data: Dict[str, Any],
         keywords: List of all available keywords
         scores_data: Dictionary containing scores data
         count: Number of keywords to select
-        used_keywords: Set of recently used keywords to avoid
+        used_keywords: Set (or other collection) of recently used keywords to avoid
 
     Returns:
         List[str]: Selected keywords
@@ -339,6 +647,13 @@ def select_keywords(keywords: List[str], scores_data: Dict[str, Any],
     # Get scores
     scores = scores_data.get("scores", {})
 
+    # Hash-based membership even if a list or other iterable was passed
+    if used_keywords and not isinstance(used_keywords, (set, frozenset)):
+        used_keywords = frozenset(used_keywords)
+
+    if NUMPY_AVAILABLE:
+        return _select_keywords_numpy(keywords, scores, count, used_keywords)
+
     # Assign default score to keywords without scores
     keyword_scores = [(k, scores.get(k, DEFAULT_KEYWORD_SCORE)) for k in keywords]
 
@@ -381,6 +696,8 @@ def extract_keywords_from_text(text: str, min_length: int = 3) -> List[str]:
     """
     Extract potential keywords from text.
 
+    Common English stopwords ("the", "and", "this", ...) and plain numbers are skipped.
+
     Args:
         text: Text to extract keywords from
         min_length: Minimum keyword length
@@ -393,19 +710,14 @@ def extract_keywords_from_text(text: str, min_length: int = 3) -> List[str]:
 
     # Convert to lowercase and remove special characters
     text = text.lower()
-    text = re.sub(r'[^\w\s]', ' ', text)
-
-    # Split into words
-    words = text.split()
+    text = text.translate(_ASCII_PUNCT_TABLE) if text.isascii() else _PUNCT_RE.sub(' ', text)
 
-    # Filter words
-    keywords = [word for word in words if len(word) >= min_length and not word.isdigit()]
+    # Split into words, dropping short words, stopwords and plain numbers
+    keywords = [word for word in text.split()
+                if len(word) >= min_length and word not in _STOPWORDS and not word.isdigit()]
 
     # Remove duplicates while preserving order
-    seen = set()
-    unique_keywords = [k for k in keywords if not (k in seen or seen.add(k))]
-
-    return unique_keywords
+    return list(dict.fromkeys(keywords))
 
 def get_keyword_performance(scores_data: Dict[str, Any], top_n: int = 10) -> List[Tuple[str, float]]:
     """
@@ -419,6 +731,14 @@ def get_keyword_performance(scores_data: Dict[str, Any], top_n: int = 10) -> Lis
         List[Tuple[str, float]]: List of (keyword, score) tuples
     """
     scores = scores_data.get("scores", {})
+    if isinstance(scores, ScoreTable):
+        return scores.top(top_n)
+
+    if NUMPY_AVAILABLE and scores:
+        # Partial selection instead of sorting the whole table
+        keys = list(scores)
+        values = np.fromiter(scores.values(), dtype=np.float64, count=len(keys))
+        return [(keys[i], scores[keys[i]]) for i in _top_indices(values, top_n).tolist()]
 
     # Sort by score (descending)
     sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
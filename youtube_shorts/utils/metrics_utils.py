@@ -13,9 +13,24 @@ Version: 1.5.0
 
 import os
 import json
+import heapq
+import uuid
 import logging
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
+
+# Try to import orjson (much faster JSON parsing/serialization)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Try to import NumPy for batched aggregate math during compaction
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 # --- NEW: Import constants from the new location ---
 try:
@@ -71,6 +86,76 @@ ERROR_SAMPLES = "error_samples"
 TOTAL_API_CALLS_PREVIOUS = "total_api_calls_previous"
 TOTAL_ERRORS_PREVIOUS = "total_errors_previous"
 
+# Event types recorded in a metrics event log
+EVENT_UPLOAD = "upload"
+EVENT_VIDEO_PERFORMANCE = "video_performance"
+EVENT_ERROR_SAMPLE = "error_sample"
+# Marks the end of the events taken by one compaction (written just before the log is renamed)
+EVENT_COMPACTION = "compaction"
+# Snapshot key holding the ID of the last event log folded into it
+COMPACTED_LOG_ID = "compacted_log_id"
+
+def _json_loads(content: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is None:
+        return json.loads(content)
+    return orjson.loads(content)
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when available."""
+    if orjson is None:
+        return json.dumps(data, ensure_ascii=False, indent=4).encode("utf-8")
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+def _write_json_file(file_path: str, data: Any) -> None:
+    """
+    Atomically write data as JSON to file_path, creating its directory if needed.
+
+    The document is serialized up front and written with a single write()
+    call; json.dump would issue a write per token.
+
+    Args:
+        file_path: Path of the JSON file
+        data: Data to write
+    """
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    # Written to <file_path>.tmp and renamed over file_path, so a crash never leaves a partial file
+    temp_path = f"{file_path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(_json_dumps(data))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, file_path)
+
+def append_event(event: Dict[str, Any], log_path: str) -> bool:
+    """
+    Appends one event to a JSONL metrics event log.
+
+    Appending costs O(event size), unlike rewriting the whole metrics file;
+    compact_metrics folds the log back into the JSON snapshot.
+
+    Args:
+        event: Event dictionary
+        log_path: Path to the event log
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        if orjson is None:
+            line = (json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8")
+        else:
+            line = orjson.dumps(event) + b"\n"
+        log_dir = os.path.dirname(log_path)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+        with open(log_path, "ab") as f:
+            f.write(line)
+        return True
+    except Exception as e:
+        logger.error(f"Error appending metrics event: {e}")
+        return False
+
 def load_metadata_metrics(metrics_file_path: str) -> Dict[str, Any]:
     """
     Loads metadata generation metrics from the JSON file.
@@ -98,33 +183,29 @@ def load_metadata_metrics(metrics_file_path: str) -> Dict[str, Any]:
     }
 
     try:
-        if os.path.exists(metrics_file_path):
-            with open(metrics_file_path, "r", encoding="utf-8") as f:
-                metrics = json.load(f)
-
-            # Ensure all keys exist
-            for key, value in default_metrics.items():
-                metrics.setdefault(key, value)
-
-            # Return a copy to prevent mutation of default values
-            return metrics.copy()
-        else:
+        # Open directly; a missing file surfaces as FileNotFoundError (no separate exists() check)
+        try:
+            with open(metrics_file_path, "rb") as f:
+                metrics = _json_loads(f.read())
+        except FileNotFoundError:
             # If file doesn't exist, create a new file with default metrics
             logger.info(f"Metadata metrics file not found: {metrics_file_path}. Creating new file with default values.")
             try:
-                os.makedirs(os.path.dirname(metrics_file_path), exist_ok=True)
-                with open(metrics_file_path, "w", encoding="utf-8") as f:
-                    json.dump(default_metrics, f, ensure_ascii=False, indent=4)
+                _write_json_file(metrics_file_path, default_metrics)
                 logger.info(f"Created new metadata metrics file: {metrics_file_path}")
             except Exception as write_err:
                 logger.error(f"Error creating new metadata metrics file: {write_err}")
 
-            # Return a copy of the default dictionary
-            return default_metrics.copy()
+            # default_metrics is built fresh on every call, so it can be returned as is
+            return default_metrics
+
+        # Ensure all keys exist (one C-level merge; values from the file win)
+        default_metrics.update(metrics)
+        return default_metrics
     except Exception as e:
         logger.warning(f"Error loading metadata metrics: {e}. Using default values.")
-        # Return a copy of the default dictionary on error
-        return default_metrics.copy()
+        # Return the (freshly built) default dictionary on error
+        return default_metrics
 
 def save_metadata_metrics(metrics: Dict[str, Any], metrics_file_path: str) -> bool:
     """
@@ -141,12 +222,8 @@ def save_metadata_metrics(metrics: Dict[str, Any], metrics_file_path: str) -> bo
         # Update last run date
         metrics[LAST_RUN_DATE] = datetime.now().isoformat()
 
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(metrics_file_path), exist_ok=True)
-
-        # Save metrics
-        with open(metrics_file_path, "w", encoding="utf-8") as f:
-            json.dump(metrics, f, ensure_ascii=False, indent=4)
+        # Save metrics (creating the directory if it doesn't exist)
+        _write_json_file(metrics_file_path, metrics)
 
         logger.info(f"Saved metadata metrics to: {metrics_file_path}")
         return True
@@ -154,35 +231,51 @@ def save_metadata_metrics(metrics: Dict[str, Any], metrics_file_path: str) -> bo
         logger.error(f"Error saving metadata metrics: {e}")
         return False
 
-def add_error_sample(metrics: Dict[str, Any], error_type: str, error_details: str,
-                    video_title: str, max_samples: int = 10) -> None:
+def add_error_sample(metrics: Union[Dict[str, Any], "MetricsBuffer"], error_type: str, error_details: str,
+                    video_title: str, max_samples: int = 10,
+                    log_path: Optional[str] = None, timestamp: Optional[str] = None) -> None:
     """
     Adds an error sample to the metadata metrics.
 
     Args:
-        metrics: Metadata metrics dictionary
+        metrics: Metadata metrics dictionary, or a MetricsBuffer
         error_type: Type of error
         error_details: Error details
         video_title: Title of the video
         max_samples: Maximum number of error samples to keep
+        log_path: Record the sample in this metrics event log instead of in metrics;
+            compact_metrics folds it into the metrics file
+        timestamp: ISO time of the error (defaults to now)
     """
+    if log_path:
+        append_event({
+            "event": EVENT_ERROR_SAMPLE,
+            "error_type": error_type,
+            "error_details": error_details,
+            "video_title": video_title,
+            "max_samples": max_samples,
+            "timestamp": timestamp or datetime.now().isoformat()
+        }, log_path)
+        return
+
+    metrics = _buffered_metrics(metrics)
     if ERROR_SAMPLES not in metrics:
         metrics[ERROR_SAMPLES] = []
+    samples = metrics[ERROR_SAMPLES]
 
     # Add new error sample
     error_sample = {
         "type": error_type,
         "details": error_details,
         "video_title": video_title,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": timestamp or datetime.now().isoformat()
     }
 
     # Add to beginning of list (most recent first)
-    metrics[ERROR_SAMPLES].insert(0, error_sample)
+    samples.insert(0, error_sample)
 
-    # Limit the number of samples
-    if len(metrics[ERROR_SAMPLES]) > max_samples:
-        metrics[ERROR_SAMPLES] = metrics[ERROR_SAMPLES][:max_samples]
+    # Limit the number of samples in place (no sliced copy)
+    del samples[max_samples:]
 
 def calculate_error_rates(metrics: Dict[str, Any]) -> Dict[str, float]:
     """
@@ -245,6 +338,12 @@ AVERAGE_COMMENTS = "average_comments"
 TOP_PERFORMING_VIDEOS = "top_performing_videos"
 ERROR_COUNTS = "error_counts"
 
+# Weight of the newest video in the view/like/comment moving averages
+EMA_ALPHA = 0.3
+
+# Below this many video events the moving averages are cheaper to update in plain Python
+NUMPY_MIN_EVENTS = 64
+
 def load_performance_metrics(metrics_file_path: str) -> Dict[str, Any]:
     """
     Loads performance metrics from the JSON file.
@@ -269,33 +368,29 @@ def load_performance_metrics(metrics_file_path: str) -> Dict[str, Any]:
     }
 
     try:
-        if os.path.exists(metrics_file_path):
-            with open(metrics_file_path, "r", encoding="utf-8") as f:
-                metrics = json.load(f)
-
-            # Ensure all keys exist
-            for key, value in default_metrics.items():
-                metrics.setdefault(key, value)
-
-            # Return a copy to prevent mutation of default values
-            return metrics.copy()
-        else:
+        # Open directly; a missing file surfaces as FileNotFoundError (no separate exists() check)
+        try:
+            with open(metrics_file_path, "rb") as f:
+                metrics = _json_loads(f.read())
+        except FileNotFoundError:
             # If file doesn't exist, create a new file with default metrics
             logger.info(f"Performance metrics file not found: {metrics_file_path}. Creating new file with default values.")
             try:
-                os.makedirs(os.path.dirname(metrics_file_path), exist_ok=True)
-                with open(metrics_file_path, "w", encoding="utf-8") as f:
-                    json.dump(default_metrics, f, ensure_ascii=False, indent=4)
+                _write_json_file(metrics_file_path, default_metrics)
                 logger.info(f"Created new performance metrics file: {metrics_file_path}")
             except Exception as write_err:
                 logger.error(f"Error creating new performance metrics file: {write_err}")
 
-            # Return a copy of the default dictionary
-            return default_metrics.copy()
+            # default_metrics is built fresh on every call, so it can be returned as is
+            return default_metrics
+
+        # Ensure all keys exist (one C-level merge; values from the file win)
+        default_metrics.update(metrics)
+        return default_metrics
     except Exception as e:
         logger.warning(f"Error loading performance metrics: {e}. Using default values.")
-        # Return a copy of the default dictionary on error
-        return default_metrics.copy()
+        # Return the (freshly built) default dictionary on error
+        return default_metrics
 
 def save_performance_metrics(metrics: Dict[str, Any], metrics_file_path: str) -> bool:
     """
@@ -318,12 +413,8 @@ def save_performance_metrics(metrics: Dict[str, Any], metrics_file_path: str) ->
         else:
             metrics[SUCCESS_RATE] = 0.0
 
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(metrics_file_path), exist_ok=True)
-
-        # Save metrics
-        with open(metrics_file_path, "w", encoding="utf-8") as f:
-            json.dump(metrics, f, ensure_ascii=False, indent=4)
+        # Save metrics (creating the directory if it doesn't exist)
+        _write_json_file(metrics_file_path, metrics)
 
         logger.info(f"Saved performance metrics to: {metrics_file_path}")
         return True
@@ -331,19 +422,28 @@ def save_performance_metrics(metrics: Dict[str, Any], metrics_file_path: str) ->
         logger.error(f"Error saving performance metrics: {e}")
         return False
 
-def update_upload_metrics(metrics: Dict[str, Any], success: bool,
-                         error_type: Optional[str] = None) -> Dict[str, Any]:
+def update_upload_metrics(metrics: Union[Dict[str, Any], "MetricsBuffer"], success: bool,
+                         error_type: Optional[str] = None,
+                         log_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Updates upload metrics with a new upload attempt.
 
     Args:
-        metrics: Performance metrics dictionary
+        metrics: Performance metrics dictionary, or a MetricsBuffer
         success: Whether the upload was successful
         error_type: Type of error if upload failed
+        log_path: Record the upload in this metrics event log instead of in metrics;
+            compact_metrics folds it into the metrics file
 
     Returns:
-        Dict[str, Any]: Updated metrics dictionary
+        Dict[str, Any]: Updated metrics dictionary (unchanged when log_path is given)
     """
+    if log_path:
+        append_event({"event": EVENT_UPLOAD, "success": success, "error_type": error_type}, log_path)
+        return _buffered_metrics(metrics, changed=False)
+
+    metrics = _buffered_metrics(metrics)
+
     # Increment total uploads
     metrics[TOTAL_UPLOADS] = metrics.get(TOTAL_UPLOADS, 0) + 1
 
@@ -366,24 +466,45 @@ def update_upload_metrics(metrics: Dict[str, Any], success: bool,
 
     return metrics
 
-def update_video_performance(metrics: Dict[str, Any], video_id: str, title: str,
+def update_video_performance(metrics: Union[Dict[str, Any], "MetricsBuffer"], video_id: str, title: str,
                             views: int, likes: int, comments: int,
-                            upload_date: Optional[str] = None) -> Dict[str, Any]:
+                            upload_date: Optional[str] = None,
+                            log_path: Optional[str] = None,
+                            timestamp: Optional[str] = None) -> Dict[str, Any]:
     """
     Updates video performance metrics.
 
     Args:
-        metrics: Performance metrics dictionary
+        metrics: Performance metrics dictionary, or a MetricsBuffer
         video_id: YouTube video ID
         title: Video title
         views: View count
         likes: Like count
         comments: Comment count
         upload_date: Upload date (ISO format)
+        log_path: Record the update in this metrics event log instead of in metrics;
+            compact_metrics folds it into the metrics file
+        timestamp: ISO time of the update (defaults to now)
 
     Returns:
-        Dict[str, Any]: Updated metrics dictionary
+        Dict[str, Any]: Updated metrics dictionary (unchanged when log_path is given)
     """
+    timestamp = timestamp or datetime.now().isoformat()
+    if log_path:
+        append_event({
+            "event": EVENT_VIDEO_PERFORMANCE,
+            "video_id": video_id,
+            "title": title,
+            "views": views,
+            "likes": likes,
+            "comments": comments,
+            "upload_date": upload_date,
+            "timestamp": timestamp
+        }, log_path)
+        return _buffered_metrics(metrics, changed=False)
+
+    metrics = _buffered_metrics(metrics)
+
     # Update average metrics if there are successful uploads
     successful_uploads = metrics.get(SUCCESSFUL_UPLOADS, 0)
     if successful_uploads > 0:
@@ -393,20 +514,21 @@ def update_video_performance(metrics: Dict[str, Any], video_id: str, title: str,
         current_avg_comments = metrics.get(AVERAGE_COMMENTS, 0)
 
         # Update with exponential moving average (more weight to recent videos)
-        alpha = 0.3  # Weight for new data
+        alpha = EMA_ALPHA  # Weight for new data
         metrics[AVERAGE_VIEWS] = (1 - alpha) * current_avg_views + alpha * views
         metrics[AVERAGE_LIKES] = (1 - alpha) * current_avg_likes + alpha * likes
         metrics[AVERAGE_COMMENTS] = (1 - alpha) * current_avg_comments + alpha * comments
 
-    # Update top performing videos
-    top_videos = metrics.get(TOP_PERFORMING_VIDEOS, [])
+    _update_top_videos(metrics, video_id, title, views, likes, comments, upload_date, timestamp)
 
-    # Check if video already exists in top videos
-    existing_index = None
-    for i, video in enumerate(top_videos):
-        if video.get("video_id") == video_id:
-            existing_index = i
-            break
+    return metrics
+
+def _update_top_videos(metrics: Dict[str, Any], video_id: str, title: str,
+                       views: int, likes: int, comments: int,
+                       upload_date: Optional[str], timestamp: str) -> None:
+    """Add or replace video_id in the top performing videos and keep the top 10 by views (timestamp: ISO update time)."""
+    # Index top performing videos by video ID (dict order keeps each video's list position)
+    top_videos = {video.get("video_id"): video for video in metrics.get(TOP_PERFORMING_VIDEOS, [])}
 
     # Create video entry
     video_entry = {
@@ -415,20 +537,247 @@ def update_video_performance(metrics: Dict[str, Any], video_id: str, title: str,
         "views": views,
         "likes": likes,
         "comments": comments,
-        "upload_date": upload_date or datetime.now().isoformat(),
-        "last_updated": datetime.now().isoformat()
+        "upload_date": upload_date or timestamp,
+        "last_updated": timestamp
     }
 
     # Update or add video
-    if existing_index is not None:
-        top_videos[existing_index] = video_entry
-    else:
-        top_videos.append(video_entry)
+    top_videos[video_id] = video_entry
+
+    # Keep only the top 10 by views (same order as a stable descending sort)
+    metrics[TOP_PERFORMING_VIDEOS] = heapq.nlargest(10, top_videos.values(), key=lambda x: x.get("views", 0))
+
+def _ema_batch(averages: List[float], samples: List[List[float]], alpha: float) -> List[float]:
+    """
+    Fold samples into exponential moving averages, as repeated avg = (1 - alpha) * avg + alpha * x.
 
-    # Sort by views in descending order
-    top_videos.sort(key=lambda x: x.get("views", 0), reverse=True)
+    With NumPy and enough samples the fold is one weighted sum per column:
+    avg_k = (1 - alpha)^k * avg_0 + sum_i alpha * (1 - alpha)^(k - 1 - i) * x_i.
 
-    # Keep only top 10
-    metrics[TOP_PERFORMING_VIDEOS] = top_videos[:10]
+    Args:
+        averages: Starting averages, one per column
+        samples: Rows of values, one column per average, oldest first
+        alpha: Weight of each new value
+
+    Returns:
+        List[float]: Final averages
+    """
+    if NUMPY_AVAILABLE and len(samples) >= NUMPY_MIN_EVENTS:
+        values = np.array(samples, dtype=np.float64)
+        weights = alpha * (1 - alpha) ** np.arange(len(samples) - 1, -1, -1, dtype=np.float64)
+        decay = (1 - alpha) ** len(samples)
+        return (decay * np.array(averages, dtype=np.float64) + weights @ values).tolist()
+
+    averages = list(averages)
+    for row in samples:
+        for column, value in enumerate(row):
+            averages[column] = (1 - alpha) * averages[column] + alpha * value
+    return averages
+
+def recompute_aggregates(metrics: Dict[str, Any], events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Applies a batch of metrics events to metrics in one pass.
+
+    Gives the same result as replaying the events one at a time, except that
+    the view/like/comment moving averages are folded in a single batch
+    (vectorized with NumPy for large batches) instead of per event. The top
+    10 list is still replayed in order, because a video that drops out of it
+    stays out even if the others later fall below it.
+
+    Args:
+        metrics: Metrics dictionary to update
+        events: Events in the order they were logged
+
+    Returns:
+        Dict[str, Any]: Updated metrics dictionary
+    """
+    # Stand-in time for events logged without one, read once for the whole batch
+    now_iso = datetime.now().isoformat()
+    samples = []
+    for event in events:
+        try:
+            if event.get("event") == EVENT_COMPACTION:
+                continue
+            if event.get("event") == EVENT_VIDEO_PERFORMANCE:
+                views, likes, comments = event["views"], event["likes"], event["comments"]
+                # Checked before anything is recorded, so a bad event cannot break the batched fold below
+                if not all(isinstance(value, (int, float)) for value in (views, likes, comments)):
+                    raise TypeError(f"non-numeric counts for video {event.get('video_id')}: "
+                                    f"{views!r}, {likes!r}, {comments!r}")
+                # Averages only move once there has been a successful upload
+                if metrics.get(SUCCESSFUL_UPLOADS, 0) > 0:
+                    samples.append([views, likes, comments])
+                _update_top_videos(metrics, event["video_id"], event["title"], views, likes, comments,
+                                   event.get("upload_date"), event.get("timestamp") or now_iso)
+            else:
+                _apply_event(metrics, event)
+        except (KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Skipping malformed metrics event: {e}")
+
+    if samples:
+        averages = [metrics.get(AVERAGE_VIEWS, 0), metrics.get(AVERAGE_LIKES, 0), metrics.get(AVERAGE_COMMENTS, 0)]
+        metrics[AVERAGE_VIEWS], metrics[AVERAGE_LIKES], metrics[AVERAGE_COMMENTS] = _ema_batch(averages, samples, EMA_ALPHA)
+
+    return metrics
+
+class MetricsBuffer:
+    """
+    Load metrics once, apply many updates in memory, and save them once.
+
+    Example:
+        with MetricsBuffer(metrics_file_path) as m:
+            for video_id, success in results:
+                m.update_upload(success)
+
+    The update functions also accept the buffer in place of a metrics dict.
+    Metrics are saved when the block exits normally and something changed;
+    if it raises, the file on disk is left untouched.
+    """
+
+    def __init__(self, metrics_file_path: str, metrics_type: str = "performance"):
+        self.metrics_file_path = metrics_file_path
+        self.metrics_type = metrics_type
+        self.metrics: Dict[str, Any] = {}
+        self.dirty = False
 
+    def __enter__(self) -> "MetricsBuffer":
+        if self.metrics_type == "metadata":
+            self.metrics = load_metadata_metrics(self.metrics_file_path)
+        else:
+            self.metrics = load_performance_metrics(self.metrics_file_path)
+        self.dirty = False
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if exc_type is None and self.dirty:
+            self.save()
+        return False
+
+    def save(self) -> bool:
+        """Save the buffered metrics now and clear the dirty flag."""
+        if self.metrics_type == "metadata":
+            saved = save_metadata_metrics(self.metrics, self.metrics_file_path)
+        else:
+            saved = save_performance_metrics(self.metrics, self.metrics_file_path)
+        if saved:
+            self.dirty = False
+        return saved
+
+    def update_upload(self, success: bool, error_type: Optional[str] = None) -> None:
+        """Record an upload attempt (see update_upload_metrics)."""
+        update_upload_metrics(self, success, error_type)
+
+    def update_video(self, video_id: str, title: str, views: int, likes: int, comments: int,
+                     upload_date: Optional[str] = None) -> None:
+        """Record video performance (see update_video_performance)."""
+        update_video_performance(self, video_id, title, views, likes, comments, upload_date)
+
+    def add_error_sample(self, error_type: str, error_details: str, video_title: str,
+                         max_samples: int = 10) -> None:
+        """Record an error sample (see add_error_sample)."""
+        add_error_sample(self, error_type, error_details, video_title, max_samples)
+
+def _buffered_metrics(metrics: Union[Dict[str, Any], MetricsBuffer], changed: bool = True) -> Dict[str, Any]:
+    """Return the metrics dict to update, marking a MetricsBuffer dirty if changed."""
+    if isinstance(metrics, MetricsBuffer):
+        if changed:
+            metrics.dirty = True
+        return metrics.metrics
     return metrics
+
+def _apply_event(metrics: Dict[str, Any], event: Dict[str, Any]) -> None:
+    """Apply one metrics event log entry to metrics."""
+    event_type = event.get("event")
+    if event_type == EVENT_UPLOAD:
+        update_upload_metrics(metrics, event["success"], event.get("error_type"))
+    elif event_type == EVENT_VIDEO_PERFORMANCE:
+        update_video_performance(metrics, event["video_id"], event["title"], event["views"],
+                                 event["likes"], event["comments"], event.get("upload_date"),
+                                 timestamp=event.get("timestamp"))
+    elif event_type == EVENT_ERROR_SAMPLE:
+        add_error_sample(metrics, event["error_type"], event["error_details"], event["video_title"],
+                         event.get("max_samples", 10), timestamp=event.get("timestamp"))
+    else:
+        logger.warning(f"Skipping unknown metrics event: {event_type}")
+
+def compact_metrics(log_path: str, snapshot_path: str, metrics_type: str = "performance") -> bool:
+    """
+    Folds a metrics event log into its JSON snapshot and clears the log.
+
+    A compaction marker with a fresh ID is appended and the log is renamed
+    before it is read, so events appended during compaction go to a new log
+    and are folded in by the next compaction. The snapshot is written
+    atomically with that ID before the log is deleted; if a crash leaves the
+    renamed log behind, the next run sees the ID in the snapshot and deletes
+    the log instead of folding it in twice. Call this periodically or on
+    shutdown.
+
+    Args:
+        log_path: Path to the JSONL event log
+        snapshot_path: Path to the aggregate metrics JSON file
+        metrics_type: "performance" or "metadata" (selects the load/save functions)
+
+    Returns:
+        bool: True if successful (or there was nothing to compact), False otherwise
+    """
+    if metrics_type == "metadata":
+        load_metrics, save_metrics = load_metadata_metrics, save_metadata_metrics
+    else:
+        load_metrics, save_metrics = load_performance_metrics, save_performance_metrics
+
+    compacting_path = f"{log_path}.compacting"
+    try:
+        # A leftover from an interrupted compaction is handled first
+        if not os.path.exists(compacting_path):
+            if not os.path.exists(log_path):
+                return True
+            if not append_event({"event": EVENT_COMPACTION, "id": uuid.uuid4().hex}, log_path):
+                return False
+            os.replace(log_path, compacting_path)
+    except Exception as e:
+        logger.error(f"Error preparing metrics event log for compaction: {e}")
+        return False
+
+    try:
+        with open(compacting_path, "rb") as f:
+            lines = f.read().splitlines()
+    except Exception as e:
+        logger.error(f"Error reading metrics event log: {e}")
+        return False
+
+    events = []
+    log_id = None
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            event = _json_loads(line)
+        except ValueError as e:
+            # A torn line from an interrupted append
+            logger.warning(f"Skipping malformed metrics event: {e}")
+            continue
+        if isinstance(event, dict) and event.get("event") == EVENT_COMPACTION:
+            log_id = event.get("id")
+        events.append(event)
+
+    metrics = load_metrics(snapshot_path)
+    if log_id is not None and metrics.get(COMPACTED_LOG_ID) == log_id:
+        logger.info(f"Metrics event log already folded into {snapshot_path}; removing it")
+    else:
+        try:
+            metrics = recompute_aggregates(metrics, events)
+        except Exception as e:
+            logger.error(f"Error folding metrics event log into {snapshot_path}: {e}")
+            return False
+        metrics[COMPACTED_LOG_ID] = log_id
+        if not save_metrics(metrics, snapshot_path):
+            return False
+
+    try:
+        os.remove(compacting_path)
+    except Exception as e:
+        logger.error(f"Error removing compacted metrics event log: {e}")
+        return False
+
+    logger.info(f"Compacted {len(events)} metrics events into: {snapshot_path}")
+    return True
@@ -52,7 +52,11 @@ if not logger.handlers:
 # Import utility modules
 try:
     from utils.metrics_utils import load_metadata_metrics, save_metadata_metrics, add_error_sample
-    from utils.date_utils import parse_date, format_date, is_older_than_days
+    from utils.metrics_utils import (
+        load_performance_metrics, save_performance_metrics, update_upload_metrics,
+        update_video_performance, compact_metrics, COMPACTED_LOG_ID, LAST_RUN_DATE
+    )
+    from utils.date_utils import parse_date, parse_dates, format_date, is_older_than_days
     from utils.cache_utils import load_cache, save_cache, cleanup_correlation_cache
     from utils.ytdlp_utils import search_videos, download_video, extract_info_from_video
     UTILS_AVAILABLE = True
@@ -81,6 +85,17 @@ def test_date_utils():
     assert is_older_than_days(old_date, 5), f"Failed to detect old date: {old_date}"
     logger.info(f"Successfully detected old date: {old_date}")
 
+    # Test parse_dates matches parse_date value by value (with or without pandas)
+    mixed_dates = [
+        "2023-01-01T12:30:45", "2023-01-01T12:30:45Z", "2023-01-01 12:30:45+05:00", "05/01/2024",
+        "5/1/2024 10:30:15", "Jan 5, 2024", "5 Jan 2024 10:30", "March 2024", "2024-01", "45000",
+        "45000.5", "now", "today", " today ", "N/A", "-", "", None, 3, "2024-13-45"
+    ]
+    batch_results = parse_dates(mixed_dates)
+    single_results = [parse_date(value) for value in mixed_dates]
+    assert batch_results == single_results, f"parse_dates disagrees with parse_date: {batch_results} != {single_results}"
+    logger.info(f"Successfully batch-parsed {len(mixed_dates)} mixed date values")
+
     logger.info("Date utilities tests passed!")
 
 def test_cache_utils():
@@ -118,6 +133,8 @@ def test_cache_utils():
                 os.remove(test_cache_path)
             if os.path.exists(f"{test_cache_path}.bak"):
                 os.remove(f"{test_cache_path}.bak")
+            if os.path.exists(f"{test_cache_path}.lock"):
+                os.remove(f"{test_cache_path}.lock")
         except Exception as e:
             logger.warning(f"Error cleaning up test cache: {e}")
 
@@ -156,6 +173,76 @@ def test_metrics_utils():
         except Exception as e:
             logger.warning(f"Error cleaning up test metrics: {e}")
 
+def test_metrics_event_log():
+    """Test the metrics event log and its compaction."""
+    logger.info("Testing metrics event log...")
+
+    test_dir = tempfile.mkdtemp()
+    log_path = os.path.join(test_dir, "performance_events.jsonl")
+    snapshot_path = os.path.join(test_dir, "performance_metrics.json")
+    compacting_path = f"{log_path}.compacting"
+
+    def comparable(metrics):
+        return {key: value for key, value in metrics.items() if key not in (LAST_RUN_DATE, COMPACTED_LOG_ID)}
+
+    updates = [
+        ("upload", True, None), ("video", "vid1", 100, 10, 1), ("upload", False, "quota"),
+        ("video", "vid2", 250, 20, 4), ("error", "quota", "Quota exceeded", "Title 2"), ("video", "vid1", 300, 30, 3)
+    ]
+
+    try:
+        # Test log -> compact gives the same metrics as updating the dict directly
+        expected = load_performance_metrics(snapshot_path)
+        for number, update in enumerate(updates):
+            timestamp = f"2024-01-05T10:00:{number:02d}"
+            if update[0] == "upload":
+                update_upload_metrics(expected, update[1], update[2])
+                update_upload_metrics({}, update[1], update[2], log_path=log_path)
+            elif update[0] == "video":
+                update_video_performance(expected, update[1], "Title", *update[2:], timestamp=timestamp)
+                update_video_performance({}, update[1], "Title", *update[2:], log_path=log_path, timestamp=timestamp)
+            else:
+                add_error_sample(expected, *update[1:], timestamp=timestamp)
+                add_error_sample({}, *update[1:], log_path=log_path, timestamp=timestamp)
+        assert compact_metrics(log_path, snapshot_path), "Failed to compact metrics event log"
+        assert not os.path.exists(log_path) and not os.path.exists(compacting_path), "Event log not removed"
+        compacted = load_performance_metrics(snapshot_path)
+        assert comparable(compacted) == comparable(expected), f"Compacted metrics differ: {compacted} != {expected}"
+        logger.info("Successfully compacted metrics event log")
+
+        # Test a leftover .compacting log whose ID is already in the snapshot is deleted, not replayed
+        update_video_performance({}, "vid3", "Title", 500, 50, 5, log_path=log_path)
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"event": "compaction", "id": "already-folded"}) + "\n")
+        os.replace(log_path, compacting_path)
+        compacted[COMPACTED_LOG_ID] = "already-folded"
+        save_performance_metrics(compacted, snapshot_path)
+        assert compact_metrics(log_path, snapshot_path), "Failed to clean up leftover compaction"
+        assert not os.path.exists(compacting_path), "Leftover compaction log not removed"
+        after = load_performance_metrics(snapshot_path)
+        assert comparable(after) == comparable(compacted), "Leftover compaction log was replayed"
+        logger.info("Successfully skipped an already folded compaction log")
+
+        # Test a torn last line (interrupted append) is skipped
+        update_upload_metrics({}, True, log_path=log_path)
+        with open(log_path, "ab") as f:
+            f.write(b'{"event": "upload", "succ')
+        assert compact_metrics(log_path, snapshot_path), "Failed to compact log with a torn line"
+        torn = load_performance_metrics(snapshot_path)
+        assert torn["total_uploads"] == after["total_uploads"] + 1, "Torn line handling changed the upload count"
+        assert not os.path.exists(compacting_path), "Compaction log with a torn line not removed"
+        logger.info("Successfully skipped a torn event log line")
+
+        logger.info("Metrics event log tests passed!")
+    finally:
+        # Clean up
+        try:
+            for name in os.listdir(test_dir):
+                os.remove(os.path.join(test_dir, name))
+            os.rmdir(test_dir)
+        except Exception as e:
+            logger.warning(f"Error cleaning up test metrics event log: {e}")
+
 def test_ytdlp_utils():
     """Test yt-dlp utilities."""
     logger.info("Testing yt-dlp utilities...")
@@ -185,6 +272,7 @@ def main():
         test_date_utils()
         test_cache_utils()
         test_metrics_utils()
+        test_metrics_event_log()
 
         # Only test yt-dlp if explicitly requested (to avoid unnecessary API calls)
         if "--test-ytdlp" in sys.argv: